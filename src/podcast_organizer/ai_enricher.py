@@ -1,372 +1,1229 @@
 """AI enrichment for podcast categorization and tagging."""
 
+import asyncio
 import json
-from typing import List, Dict, Optional
+import math
+import time
+from functools import lru_cache
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Dict, Optional, Sequence, Tuple
 from abc import ABC, abstractmethod
 
-from anthropic import Anthropic
-from openai import OpenAI
+import anthropic
+import httpx
+import openai
+from pydantic import BaseModel, ConfigDict, ValidationError
+from anthropic import Anthropic, AsyncAnthropic
+from openai import OpenAI, AsyncOpenAI
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 from .rss_fetcher import PodcastMetadata
 from .config import AIConfig
-from .tag_generator import generate_tags_for_podcast, deduplicate_tags
+from .tag_generator import generate_tags_for_podcasts_batch, deduplicate_tags
 from .logger import get_logger
+from .cache import PodcastCache, ResponseCache, podcast_cache_key, response_cache_key
+from .rate_limiter import RateLimiter, estimate_request_tokens, estimate_tokens
+from .retry import retry_async
+
+
+# Transient errors retried with backoff (covers rate limits, overload, timeouts)
+CLAUDE_RETRYABLE_ERRORS = (anthropic.APIConnectionError, anthropic.APIStatusError)
+OPENAI_RETRYABLE_ERRORS = (openai.APIConnectionError, openai.APIStatusError)
+
+# SDK retries (exponential backoff, honors Retry-After) for the blocking clients,
+# which submit and poll batch jobs where one transient error would abort the run
+SYNC_CLIENT_MAX_RETRIES = 5
+
+
+class InvalidResultError(Exception):
+    """Raised when a response carries no usable result (refusal, missing tool call, truncation)."""
+
+
+# Response failures a shard logs and skips, besides the provider's API errors
+RESULT_ERRORS = (ValidationError, InvalidResultError)
+
+
+# Tool Claude is forced to call, so its result arrives as schema-shaped input
+RESULT_TOOL_NAME = "record_result"
+
+# Connection pool limits for the shared HTTP/2 API clients
+HTTP_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Seconds between status checks while a provider batch job is running
+BATCH_POLL_INTERVAL = 30
+
+# Token budgets for sizing tag batches (tokens are estimated at ~4 characters each)
+TAG_MAX_INPUT_TOKENS = 60000
+TAG_MAX_OUTPUT_TOKENS = 8000
+TAG_OUTPUT_TOKENS_PER_PODCAST = 40  # ID + 3-5 short tags, with headroom
+TAG_ROW_OVERHEAD_TOKENS = 10  # ID, separators and category column per prompt row
+TAG_MIN_BATCH_SIZE = 10  # below this, parallel requests cost more than they save
+
+# Static instructions sent as the system prompt. They are byte-identical across
+# requests so the provider can cache the prefix (Claude cache_control, OpenAI
+# automatic prompt caching); only the podcast list in the user message varies.
+CATEGORIZE_SYSTEM_PROMPT = """You are helping organize a podcast collection. The user will send a list of podcasts with their AI-generated tags.
+
+Please analyze these podcasts and:
+1. Create logical category groupings (e.g., "Technology & AI", "Business & Entrepreneurship", "News & Politics", "Health & Wellness", etc.)
+2. Assign each podcast to ONE category based on its title, description, and tags (tags provide semantic signals about the podcast's themes)
+3. Use clear, descriptive category names that reflect the common themes
+
+Return your response as a JSON object with this structure:
+
+{"categories":[{"name":"Technology & AI","podcast_ids":[0,1,5,8,12]},{"name":"Business & Entrepreneurship","podcast_ids":[2,3,4]},{"name":"News & Politics","podcast_ids":[6,7,9]}]}
+
+IMPORTANT:
+- Include ALL podcast IDs from the list in the categories
+- Each podcast must be assigned to exactly ONE category
+- Pay attention to the tags - they often reveal the true theme of a podcast
+- Only return valid JSON, no other text or explanations
+
+Use the podcast IDs (0, 1, 2, etc.) to reference podcasts."""
+
+TAG_SYSTEM_PROMPT = """You generate relevant tags for podcasts. The user will send a list of podcasts; generate 3-5 tags for each one.
+
+For each podcast, create tags that:
+1. Reflect the podcast's category and topic
+2. Include relevant keywords from the title
+3. Are concise (1-2 words each)
+4. Are lowercase without # symbol
+5. Use dashes to join multi-word tags (e.g., "venture-capital" not "venture capital")
+
+Return JSON in this format:
+{"podcasts":[{"id":0,"tags":["technology","business","venture-capital"]},{"id":1,"tags":["news","politics","world-affairs"]}]}
+
+Include ALL podcast IDs from the list. Return only valid JSON."""
+
+ENRICH_SYSTEM_PROMPT = """You are helping organize a podcast collection. The user will send a list of podcasts that need to be categorized and tagged.
+
+For each podcast:
+1. Assign ONE category from logical groupings (e.g., "Technology & AI", "Business & Entrepreneurship", "News & Politics", "Health & Wellness", etc.)
+2. Generate 3-5 tags that are concise (1-2 words each), lowercase without # symbol, and use dashes to join multi-word tags (e.g., "venture-capital" not "venture capital")
+3. Use clear, descriptive category names and reuse the same name for podcasts with a common theme
+
+Return JSON in this format:
+{"podcasts":[{"id":0,"category":"Technology & AI","tags":["technology","business","venture-capital"]},{"id":1,"category":"News & Politics","tags":["news","politics","world-affairs"]}]}
+
+IMPORTANT:
+- Include ALL podcast IDs from the list
+- Each podcast must be assigned to exactly ONE category
+- Only return valid JSON, no other text or explanations"""
+
+# Tool result sent once when Claude's tool input did not match the result schema
+SCHEMA_REASK_PROMPT = "The result did not match the schema ({error}). Call the tool again with the complete, corrected result."
+
+# Prepended to categorization prompts when some podcasts already use feed categories
+KNOWN_CATEGORIES_PROMPT = """Categories already in use (reuse one when it fits): {categories}
+
+"""
+
+# Per-request user message: just the podcast list
+PODCASTS_PROMPT = """{count} podcasts (IDs {first_id} through {last_id}), one per line with tab-separated columns:
+
+{podcast_rows}"""
+
+
+class CategoryAssignment(BaseModel):
+    """One category and the IDs of the podcasts assigned to it."""
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    podcast_ids: List[int]
+
+
+class CategorizationResult(BaseModel):
+    """
+    Result schema for categorization responses.
+
+    Enforced with Structured Outputs on OpenAI and forced tool use on Claude.
+    Strict schemas cannot have free-form object keys, so categories are a
+    list of assignments rather than a name -> IDs mapping.
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    categories: List[CategoryAssignment]
+
+    def to_dict(self) -> Dict:
+        """Convert to the {"categories": {name: [ids]}} shape used by the enricher."""
+        return {"categories": {c.name: c.podcast_ids for c in self.categories}}
+
+
+class PodcastTags(BaseModel):
+    """Tags for one podcast."""
+    model_config = ConfigDict(extra="forbid")
+
+    id: int
+    tags: List[str]
+
+
+class TagResult(BaseModel):
+    """Result schema for tag generation responses."""
+    model_config = ConfigDict(extra="forbid")
+
+    podcasts: List[PodcastTags]
+
+    def to_dict(self) -> Dict:
+        """Convert to the {"tags": {id: [tags]}} shape used by the enricher."""
+        return {"tags": {str(p.id): p.tags for p in self.podcasts}}
+
+
+class PodcastEnrichment(BaseModel):
+    """Category and tags for one podcast."""
+    model_config = ConfigDict(extra="forbid")
+
+    id: int
+    category: str
+    tags: List[str]
+
+
+class EnrichmentResult(BaseModel):
+    """Result schema for single-pass enrichment responses."""
+    model_config = ConfigDict(extra="forbid")
+
+    podcasts: List[PodcastEnrichment]
+
+    def to_dict(self) -> Dict:
+        """Convert to the {"podcasts": {id: {"category": ..., "tags": [...]}}} shape used by the enricher."""
+        return {"podcasts": {str(p.id): {"category": p.category, "tags": p.tags} for p in self.podcasts}}
+
+
+def json_schema_format(result_type: type) -> Dict:
+    """
+    Build a strict Structured Outputs response_format for a raw request body.
+
+    Args:
+        result_type: Result model (CategorizationResult, TagResult, ...)
+
+    Returns:
+        response_format dict for the Chat Completions API
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": result_type.__name__,
+            "schema": result_type.model_json_schema(),
+            "strict": True
+        }
+    }
+
+
+def encode_indented(data) -> bytes:
+    """
+    Encode data as 2-space indented UTF-8 JSON, using orjson when available.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON (non-ASCII characters are kept as-is)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def encode_compact(data) -> bytes:
+    """
+    Encode data as compact UTF-8 JSON (no whitespace), using orjson when available.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON (non-ASCII characters are kept as-is)
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(content):
+    """
+    Parse JSON text, using orjson when available.
+
+    Args:
+        content: JSON document (str or bytes)
+
+    Returns:
+        Parsed object
+
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON (orjson's error is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def format_podcast_rows(podcast_list: List[Dict]) -> str:
+    """
+    Format a podcast list as tab-separated rows for prompts.
+
+    Column names are given once in a header row instead of repeating JSON
+    keys, quotes and brackets for every podcast, which saves prompt tokens.
+
+    Args:
+        podcast_list: Dicts with the same keys (list values are comma-joined)
+
+    Returns:
+        Header row followed by one row per podcast
+    """
+    rows = ["\t".join(podcast_list[0])]
+    for entry in podcast_list:
+        rows.append("\t".join(
+            # Collapse tabs/newlines so every podcast stays on one row
+            " ".join((", ".join(value) if isinstance(value, list) else str(value)).split())
+            for value in entry.values()
+        ))
+    return "\n".join(rows)
+
+
+class _TextExtractor(HTMLParser):
+    """Collect the text content of an HTML fragment, skipping script/style bodies."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+@lru_cache(maxsize=4096)
+def _plain_text(text: str) -> str:
+    """Convert an HTML fragment to plain text with collapsed whitespace (memoized)."""
+    if "<" in text or "&" in text:
+        extractor = _TextExtractor()
+        extractor.feed(text)
+        extractor.close()
+        text = " ".join(extractor.parts)
+
+    return " ".join(text.split())
+
+
+def clean_description(text: Optional[str], max_length: int = 800) -> str:
+    """
+    Strip HTML markup and entities from a description for use in prompts.
+
+    Tags, inline styles and links cost prompt tokens without helping
+    categorization. The cleaned text is memoized, so each description is
+    parsed once even though both AI passes (and both lengths) use it.
+
+    Args:
+        text: Raw RSS description (may contain HTML)
+        max_length: Maximum length of the cleaned text
+
+    Returns:
+        Plain text with collapsed whitespace (empty if only markup)
+    """
+    if not text:
+        return ""
+
+    return _plain_text(text)[:max_length]
 
 
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
 
-    @abstractmethod
-    def enrich_podcasts(self, podcasts: List[PodcastMetadata]) -> Dict:
+    # Errors from the provider's SDK that fail a single request
+    api_errors: Tuple[type, ...] = ()
+
+    def __init__(
+        self,
+        max_concurrent: int = 5,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None
+    ):
+        self.max_concurrent = max_concurrent
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.response_cache = response_cache
+
+    async def aclose(self) -> None:
+        """Close the API clients and their HTTP connection pools."""
+        await self.aclient.close()
+        self.client.close()
+
+    def _cached_response(self, *prompts: str) -> Optional[Dict]:
+        """Return the cached parsed response for these prompts, if any."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(response_cache_key(self.model, *prompts))
+
+    def _cache_response(self, data: Dict, *prompts: str) -> None:
+        """Store a parsed response for these prompts."""
+        if self.response_cache is not None:
+            self.response_cache.set(response_cache_key(self.model, *prompts), data)
+
+    async def enrich_podcasts(
+        self,
+        podcasts: List[PodcastMetadata],
+        batch_size: int = 30,
+        known_categories: Sequence[str] = ()
+    ) -> Dict:
         """
-        Enrich podcasts with categories and tags.
+        Enrich podcasts with categories.
+
+        The collection is split into shards that are categorized concurrently
+        (bounded by max_concurrent). Each shard's result is merged into the
+        category mapping as soon as it completes and then released.
 
         Args:
             podcasts: List of PodcastMetadata objects
+            batch_size: Number of podcasts per categorization request
+            known_categories: Category names already in use, offered for reuse
 
         Returns:
             Dict with categorization and enrichment data
         """
-        pass
+        semaphore = asyncio.Semaphore(self.max_concurrent)
 
-    @abstractmethod
-    def generate_tags_batch(self, podcasts: List[PodcastMetadata], batch_size: int = 25) -> Dict:
+        async def categorize_with_semaphore(offset: int) -> Tuple[int, Dict]:
+            async with semaphore:
+                return offset, await self._categorize_shard(podcasts[offset:offset + batch_size], known_categories)
+
+        categories: Dict[str, List[int]] = {}
+        for next_shard in asyncio.as_completed(
+            [categorize_with_semaphore(offset) for offset in range(0, len(podcasts), batch_size)]
+        ):
+            offset, shard_data = await next_shard
+            self._merge_shard(categories, offset, shard_data)
+
+        return {"categories": categories}
+
+    async def enrich_and_tag_podcasts(self, podcasts: List[PodcastMetadata], batch_size: int = 30) -> Dict:
+        """
+        Categorize and tag podcasts in a single pass.
+
+        Each shard is one request returning both the category and the tags of
+        its podcasts, halving the requests of the two-pass flow at the cost of
+        categorizing without the AI tags as extra signal.
+
+        Args:
+            podcasts: List of PodcastMetadata objects
+            batch_size: Number of podcasts per request
+
+        Returns:
+            Dict with "categories" (name -> IDs) and "tags" (ID -> list of tags)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def enrich_with_semaphore(offset: int) -> Tuple[int, Dict]:
+            async with semaphore:
+                return offset, await self._enrich_shard(podcasts[offset:offset + batch_size])
+
+        categories: Dict[str, List[int]] = {}
+        tags: Dict[str, List[str]] = {}
+        for next_shard in asyncio.as_completed(
+            [enrich_with_semaphore(offset) for offset in range(0, len(podcasts), batch_size)]
+        ):
+            offset, shard_data = await next_shard
+            self._merge_enriched_shard(categories, tags, offset, shard_data)
+
+        return {"categories": categories, "tags": tags}
+
+    async def generate_tags_batch(self, podcasts: List[PodcastMetadata]) -> Dict:
         """
         Generate tags for podcasts in batches.
 
+        Batches are sized by _pack_tag_batches, sent concurrently (bounded by
+        max_concurrent) and merged as they complete; a failed batch is skipped
+        so its podcasts fall back to auto-generated tags.
+
         Args:
             podcasts: List of PodcastMetadata objects
-            batch_size: Number of podcasts per batch
 
         Returns:
             Dict mapping podcast index to list of tags
         """
-        pass
+        semaphore = asyncio.Semaphore(self.max_concurrent)
 
+        async def tag_with_semaphore(start_id: int, end_id: int) -> Optional[Dict]:
+            async with semaphore:
+                return await self._tag_shard(podcasts[start_id:end_id], start_id)
 
-class ClaudeProvider(AIProvider):
-    """Claude (Anthropic) AI provider."""
+        all_tags = {}
+        for next_batch in asyncio.as_completed(
+            [tag_with_semaphore(start_id, end_id) for start_id, end_id in self._pack_tag_batches(podcasts)]
+        ):
+            batch_tags = await next_batch
+            if batch_tags and "tags" in batch_tags:
+                all_tags.update(batch_tags["tags"])
 
-    def __init__(self, api_key: str, model: Optional[str] = None):
-        self.client = Anthropic(api_key=api_key)
-        self.model = model or "claude-3-5-sonnet-20241022"
+        return {"tags": all_tags}
 
-    def enrich_podcasts(self, podcasts: List[PodcastMetadata]) -> Dict:
-        """Enrich podcasts using Claude."""
-        # Build podcast list for prompt (include tags from Pass 1)
-        podcast_list = []
-        for i, p in enumerate(podcasts):
-            podcast_list.append({
-                "id": i,
-                "title": p.display_title,
-                "description": p.description or "No description available",
-                "tags": p.tags or []
-            })
+    async def generate_tags_stream(
+        self,
+        podcasts: AsyncIterable[PodcastMetadata],
+        expected_count: Optional[int] = None
+    ) -> Dict:
+        """
+        Generate tags for podcasts as they arrive from a stream.
 
-        prompt = self._build_prompt(podcast_list)
+        Arriving podcasts are packed with _pack_tag_batches; each batch is
+        sent as soon as it is full, while later podcasts still arrive, and
+        the remainder is packed and sent once the stream ends.
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=8000,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+        Args:
+            podcasts: PodcastMetadata objects, e.g. as their feeds are fetched
+            expected_count: Approximate number of podcasts the stream yields,
+                used to size the batches (default: size them as they arrive)
+
+        Returns:
+            Dict mapping podcast index (in arrival order) to list of tags
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        received: List[PodcastMetadata] = []
+        tag_tasks = []
+        start = 0
+
+        async def tag_with_semaphore(start_id: int, end_id: int) -> Optional[Dict]:
+            async with semaphore:
+                return await self._tag_shard(received[start_id:end_id], start_id)
+
+        def send_batches(final: bool) -> None:
+            nonlocal start
+            batches = self._pack_tag_batches(received[start:], expected_count)
+            # The last batch may still grow until the stream ends
+            if not final:
+                batches = batches[:-1]
+            for batch_start, batch_end in batches:
+                tag_tasks.append(asyncio.create_task(tag_with_semaphore(start + batch_start, start + batch_end)))
+            if batches:
+                start += batches[-1][1]
+
+        async for podcast in podcasts:
+            received.append(podcast)
+            send_batches(final=False)
+        send_batches(final=True)
+
+        all_tags = {}
+        for batch_tags in await asyncio.gather(*tag_tasks):
+            if batch_tags and "tags" in batch_tags:
+                all_tags.update(batch_tags["tags"])
+
+        return {"tags": all_tags}
+
+    def _pack_tag_batches(
+        self,
+        podcasts: List[PodcastMetadata],
+        expected_count: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Split podcasts into contiguous tag batches sized to the token budgets.
+
+        Podcasts are spread evenly over the max_concurrent request slots, so
+        smaller collections still run in parallel, and each batch is capped by
+        the estimated input and output tokens so large collections need as
+        few requests as possible.
+
+        Args:
+            podcasts: List of PodcastMetadata objects
+            expected_count: Collection size spread over the request slots
+                (default: len(podcasts))
+
+        Returns:
+            (start, end) index ranges, one per batch
+        """
+        target_size = min(
+            max(TAG_MIN_BATCH_SIZE, math.ceil((expected_count or len(podcasts)) / self.max_concurrent)),
+            TAG_MAX_OUTPUT_TOKENS // TAG_OUTPUT_TOKENS_PER_PODCAST
+        )
+
+        batches = []
+        start = 0
+        input_tokens = 0
+        for i, podcast in enumerate(podcasts):
+            tokens = (
+                estimate_tokens(podcast.display_title)
+                + estimate_tokens(clean_description(podcast.description, max_length=200))
+                + TAG_ROW_OVERHEAD_TOKENS
             )
+            if i > start and (i - start >= target_size or input_tokens + tokens > TAG_MAX_INPUT_TOKENS):
+                batches.append((start, i))
+                start = i
+                input_tokens = 0
+            input_tokens += tokens
+
+        if start < len(podcasts):
+            batches.append((start, len(podcasts)))
+        return batches
+
+    @staticmethod
+    def _tag_max_tokens(podcast_count: int) -> int:
+        """Response token limit for a tag batch of podcast_count podcasts."""
+        return min(TAG_MAX_OUTPUT_TOKENS, 200 + podcast_count * TAG_OUTPUT_TOKENS_PER_PODCAST)
+
+    @staticmethod
+    def _merge_shard(categories: Dict[str, List[int]], offset: int, shard_data: Optional[Dict]) -> None:
+        """
+        Merge one shard's categorization result into the collection mapping.
 
-            # Parse JSON response
-            content = response.content[0].text
-            return self._parse_response(content, podcasts)
+        Args:
+            categories: Mapping of category name to collection-wide IDs (updated in place)
+            offset: Index of the shard's first podcast in the full collection
+            shard_data: Parsed response for the shard (None if the shard failed)
+        """
+        if not shard_data:
+            return
+        # Shift shard-local IDs back to collection IDs
+        for category, podcast_ids in shard_data.get("categories", {}).items():
+            categories.setdefault(category, []).extend(
+                int(podcast_id) + offset for podcast_id in podcast_ids
+            )
 
-        except Exception as e:
-            logger = get_logger()
-            logger.error(f"Error calling Claude API: {e}")
-            raise
+    @staticmethod
+    def _merge_enriched_shard(
+        categories: Dict[str, List[int]],
+        tags: Dict[str, List[str]],
+        offset: int,
+        shard_data: Optional[Dict]
+    ) -> None:
+        """
+        Merge one shard's single-pass result into the collection mappings.
 
-    def _build_prompt(self, podcast_list: List[Dict]) -> str:
-        """Build categorization prompt for Claude (uses tags for improved accuracy)."""
-        podcasts_json = json.dumps(podcast_list, indent=2)
+        Args:
+            categories: Mapping of category name to collection-wide IDs (updated in place)
+            tags: Mapping of collection-wide ID (as str) to tags (updated in place)
+            offset: Index of the shard's first podcast in the full collection
+            shard_data: Parsed response for the shard (None if the shard failed)
+        """
+        if not shard_data:
+            return
+        for podcast_id, entry in shard_data.get("podcasts", {}).items():
+            podcast_id = int(podcast_id) + offset
+            if entry.get("category"):
+                categories.setdefault(entry["category"], []).append(podcast_id)
+            if entry.get("tags"):
+                tags[str(podcast_id)] = entry["tags"]
+
+    @classmethod
+    def _merge_categories(cls, offsets: Iterable[int], results: Iterable[Optional[Dict]]) -> Dict[str, List[int]]:
+        """
+        Merge per-shard categorization results.
 
-        return f"""You are helping organize a podcast collection. I have {len(podcast_list)} podcasts that need to be categorized.
+        Args:
+            offsets: Index of each shard's first podcast in the full collection
+            results: Parsed response for each shard (None if the shard failed)
 
-Here are the podcasts with their AI-generated tags:
+        Returns:
+            Dict mapping category name to collection-wide podcast IDs
+        """
+        categories: Dict[str, List[int]] = {}
+        for offset, shard_data in zip(offsets, results):
+            cls._merge_shard(categories, offset, shard_data)
+        return categories
+
+    @staticmethod
+    def _build_prompt(podcast_list: List[Dict]) -> str:
+        """Build the user message for a podcast list (instructions go in the system prompt)."""
+        return PODCASTS_PROMPT.format(
+            count=len(podcast_list),
+            first_id=podcast_list[0]["id"],
+            last_id=podcast_list[-1]["id"],
+            podcast_rows=format_podcast_rows(podcast_list)
+        )
+
+    @classmethod
+    def _build_categorize_prompt(cls, podcasts: List[PodcastMetadata], known_categories: Sequence[str] = ()) -> str:
+        """Build the user message for a categorization prompt."""
+        prompt = cls._build_prompt(cls._build_categorize_list(podcasts))
+        if known_categories:
+            prompt = KNOWN_CATEGORIES_PROMPT.format(categories=", ".join(known_categories)) + prompt
+        return prompt
+
+    @staticmethod
+    def _build_categorize_list(podcasts: List[PodcastMetadata]) -> List[Dict]:
+        """Build the podcast list for a categorization prompt (includes tags from Pass 1)."""
+        return [
+            {
+                "id": i,
+                "title": p.display_title,
+                "description": clean_description(p.description) or "No description available",
+                "tags": p.tags or []
+            }
+            for i, p in enumerate(podcasts)
+        ]
+
+    @staticmethod
+    def _build_enrich_list(podcasts: List[PodcastMetadata]) -> List[Dict]:
+        """Build the podcast list for a single-pass prompt."""
+        return [
+            {
+                "id": i,
+                "title": p.display_title,
+                "description": clean_description(p.description) or "No description available"
+            }
+            for i, p in enumerate(podcasts)
+        ]
+
+    @staticmethod
+    def _build_tag_list(podcasts: List[PodcastMetadata], start_id: int = 0) -> List[Dict]:
+        """Build the podcast list for a tag generation prompt."""
+        return [
+            {
+                "id": start_id + j,
+                "title": p.display_title,
+                "category": p.category or "Uncategorized",
+                "description": clean_description(p.description, max_length=200)  # Truncate long descriptions
+            }
+            for j, p in enumerate(podcasts)
+        ]
+
+    async def _categorize_shard(
+        self,
+        podcasts: List[PodcastMetadata],
+        known_categories: Sequence[str] = ()
+    ) -> Optional[Dict]:
+        """
+        Categorize a single shard of podcasts.
 
-{podcasts_json}
+        A failed shard is logged and skipped so the rest of the collection is
+        still categorized; its podcasts stay uncategorized.
 
-Please analyze these podcasts and:
-1. Create logical category groupings (e.g., "Technology & AI", "Business & Entrepreneurship", "News & Politics", "Health & Wellness", etc.)
-2. Assign each podcast to ONE category based on its title, description, and tags (tags provide semantic signals about the podcast's themes)
-3. Use clear, descriptive category names that reflect the common themes
+        Args:
+            podcasts: List of PodcastMetadata objects (IDs are shard-local)
+            known_categories: Category names already in use, offered for reuse
 
-Return your response as a JSON object with this structure:
+        Returns:
+            Dict with "categories" mapping category name to shard-local IDs (None if the shard failed)
+        """
+        try:
+            return await self._request(
+                CATEGORIZE_SYSTEM_PROMPT, self._build_categorize_prompt(podcasts, known_categories), CategorizationResult
+            )
+        except self.api_errors + RESULT_ERRORS as e:
+            get_logger().warning(f"Warning: Failed to categorize {len(podcasts)} podcasts: {e}")
+            return None
 
-{{
-  "categories": {{
-    "Technology & AI": [0, 1, 5, 8, 12],
-    "Business & Entrepreneurship": [2, 3, 4],
-    "News & Politics": [6, 7, 9]
-  }}
-}}
+    async def _enrich_shard(self, podcasts: List[PodcastMetadata]) -> Optional[Dict]:
+        """
+        Categorize and tag a single shard of podcasts.
 
-IMPORTANT:
-- Include ALL podcast IDs (0 through {len(podcast_list)-1}) in the categories
-- Each podcast must be assigned to exactly ONE category
-- Pay attention to the tags - they often reveal the true theme of a podcast
-- Only return valid JSON, no other text or explanations
+        A failed shard is logged and skipped; its podcasts stay uncategorized
+        and fall back to auto-generated tags.
 
-Use the podcast IDs (0, 1, 2, etc.) to reference podcasts."""
+        Args:
+            podcasts: List of PodcastMetadata objects (IDs are shard-local)
 
-    def _parse_response(self, content: str, podcasts: List[PodcastMetadata]) -> Dict:
-        """Parse Claude's JSON response."""
+        Returns:
+            Dict with "podcasts" mapping shard-local ID to its category and tags (None if the shard failed)
+        """
         try:
-            # Try to extract JSON from response
-            # Sometimes Claude wraps JSON in markdown code blocks
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                content = content[start:end].strip()
-
-            data = json.loads(content)
-            return data
-
-        except json.JSONDecodeError as e:
-            logger = get_logger()
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.warning(f"Response: {content}")
-            raise
+            return await self._request(
+                ENRICH_SYSTEM_PROMPT, self._build_prompt(self._build_enrich_list(podcasts)), EnrichmentResult
+            )
+        except self.api_errors + RESULT_ERRORS as e:
+            get_logger().warning(f"Warning: Failed to categorize and tag {len(podcasts)} podcasts: {e}")
+            return None
 
-    def generate_tags_batch(self, podcasts: List[PodcastMetadata], batch_size: int = 25) -> Dict:
-        """Generate tags for podcasts in batches using Claude."""
-        all_tags = {}
+    async def _tag_shard(self, podcasts: List[PodcastMetadata], start_id: int) -> Optional[Dict]:
+        """
+        Generate tags for a single batch of podcasts.
 
-        # Process in batches
-        for i in range(0, len(podcasts), batch_size):
-            batch = podcasts[i:i + batch_size]
-            batch_data = [
-                {
-                    "id": i + j,
-                    "title": p.display_title,
-                    "category": p.category or "Uncategorized",
-                    "description": (p.description or "")[:200]  # Truncate long descriptions
-                }
-                for j, p in enumerate(batch)
-            ]
+        Args:
+            podcasts: List of PodcastMetadata objects
+            start_id: ID of the batch's first podcast in the full collection
 
-            prompt = self._build_tag_prompt(batch_data)
+        Returns:
+            Dict with "tags" mapping podcast ID to list of tags (None if the batch failed)
+        """
+        prompt = self._build_prompt(self._build_tag_list(podcasts, start_id=start_id))
 
-            try:
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=4000,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
+        try:
+            return await self._request(
+                TAG_SYSTEM_PROMPT, prompt, TagResult, max_tokens=self._tag_max_tokens(len(podcasts))
+            )
+        except self.api_errors + RESULT_ERRORS as e:
+            logger = get_logger()
+            logger.warning(f"Warning: Failed to generate tags for podcasts {start_id + 1}-{start_id + len(podcasts)}: {e}")
+            return None
 
-                content = response.content[0].text
-                batch_tags = self._parse_response(content, batch)
+    async def _request(self, system_prompt: str, prompt: str, result_type: type, max_tokens: int = 8000) -> Dict:
+        """
+        Send one request, reusing a cached response for identical prompts.
 
-                # Merge batch results
-                if "tags" in batch_tags:
-                    all_tags.update(batch_tags["tags"])
+        Args:
+            system_prompt: Static instructions
+            prompt: Podcast list user message
+            result_type: Result model the response must match
+            max_tokens: Response token limit
 
-            except Exception as e:
-                logger = get_logger()
-                logger.warning(f"Warning: Failed to generate tags for batch {i//batch_size + 1}: {e}")
-                continue
+        Returns:
+            Result converted with result_type.to_dict()
+        """
+        # SQLite lookups and writes run off the event loop
+        cached = await asyncio.to_thread(self._cached_response, system_prompt, prompt)
+        if cached is not None:
+            return cached
 
-        return {"tags": all_tags}
+        data = await self._chat(system_prompt, prompt, result_type, max_tokens)
+        await asyncio.to_thread(self._cache_response, data, system_prompt, prompt)
+        return data
 
-    def _build_tag_prompt(self, podcast_list: List[Dict]) -> str:
-        """Build tag generation prompt for Claude."""
-        podcasts_json = json.dumps(podcast_list, indent=2)
+    @abstractmethod
+    async def _chat(self, system_prompt: str, prompt: str, result_type: type, max_tokens: int) -> Dict:
+        """
+        Call the provider's API with a schema-enforced response.
 
-        return f"""Generate 3-5 relevant tags for each of these {len(podcast_list)} podcasts.
+        Args:
+            system_prompt: Static instructions
+            prompt: Podcast list user message
+            result_type: Result model the response must match
+            max_tokens: Response token limit
 
-Podcasts:
-{podcasts_json}
+        Returns:
+            Result converted with result_type.to_dict()
 
-For each podcast, create tags that:
-1. Reflect the podcast's category and topic
-2. Include relevant keywords from the title
-3. Are concise (1-2 words each)
-4. Are lowercase without # symbol
-5. Use dashes to join multi-word tags (e.g., "venture-capital" not "venture capital")
+        Raises:
+            The provider's API errors (see api_errors), pydantic.ValidationError
+            or InvalidResultError
+        """
+        pass
 
-Return JSON in this format:
-{{
-  "tags": {{
-    "0": ["technology", "business", "venture-capital"],
-    "1": ["news", "politics", "world-affairs"]
-  }}
-}}
 
-Include ALL podcast IDs (0 through {len(podcast_list)-1}). Return only valid JSON."""
+class ClaudeProvider(AIProvider):
+    """Claude (Anthropic) AI provider."""
 
+    api_errors = (anthropic.APIError,)
+
+    def __init__(
+        self,
+        api_key: str,
+        model: Optional[str] = None,
+        max_concurrent: int = 5,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        sync_http_client: Optional[httpx.Client] = None
+    ):
+        super().__init__(max_concurrent, rate_limiter, response_cache)
+        self.client = Anthropic(api_key=api_key, max_retries=SYNC_CLIENT_MAX_RETRIES, http_client=sync_http_client)
+        # Retries are handled by retry_async, so disable the SDK's own retry loop
+        self.aclient = AsyncAnthropic(api_key=api_key, max_retries=0, http_client=http_client)
+        self.model = model or "claude-3-5-sonnet-20241022"
 
-class OpenAIProvider(AIProvider):
-    """OpenAI (GPT) AI provider."""
+    @staticmethod
+    def _system_blocks(system_prompt: str) -> List[Dict]:
+        """Wrap a system prompt in a text block marked for prompt caching."""
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+    @staticmethod
+    def _result_tool(result_type: type) -> Dict:
+        """Describe the tool Claude is forced to call with a result_type-shaped input."""
+        return {
+            "name": RESULT_TOOL_NAME,
+            "description": "Record the result for the podcast list.",
+            "input_schema": result_type.model_json_schema()
+        }
+
+    async def _chat(self, system_prompt: str, prompt: str, result_type: type, max_tokens: int) -> Dict:
+        """Stream a forced tool call for the prompts and validate its input against result_type."""
+        messages = [{"role": "user", "content": prompt}]
+
+        async def stream_message():
+            await self.rate_limiter.acquire(estimate_request_tokens(system_prompt, prompt, max_tokens))
+
+            # Forced tool use: the result arrives as already-parsed tool input
+            async with self.aclient.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._system_blocks(system_prompt),
+                messages=messages,
+                tools=[self._result_tool(result_type)],
+                tool_choice={"type": "tool", "name": RESULT_TOOL_NAME}
+            ) as stream:
+                message = await stream.get_final_message()
 
-    def __init__(self, api_key: str, model: Optional[str] = None):
-        self.client = OpenAI(api_key=api_key)
-        self.model = model or "gpt-4-turbo-preview"
+            if message.stop_reason == "max_tokens":
+                get_logger().warning("Warning: Claude response hit max_tokens and may be truncated")
 
-    def enrich_podcasts(self, podcasts: List[PodcastMetadata]) -> Dict:
-        """Enrich podcasts using OpenAI."""
-        # Build podcast list for prompt (include tags from Pass 1)
-        podcast_list = []
-        for i, p in enumerate(podcasts):
-            podcast_list.append({
-                "id": i,
-                "title": p.display_title,
-                "description": p.description or "No description available",
-                "tags": p.tags or []
-            })
+            return message
 
-        prompt = self._build_prompt(podcast_list)
+        while True:
+            try:
+                message = await retry_async(stream_message, CLAUDE_RETRYABLE_ERRORS)
+            except anthropic.APIError as e:
+                logger = get_logger()
+                logger.error(f"Error calling Claude API: {e}")
+                raise
 
-        try:
-            response = self.client.chat.completions.create(
+            tool_use = next((block for block in message.content if block.type == "tool_use"), None)
+            try:
+                if tool_use is None:
+                    raise InvalidResultError("Claude response contained no tool call")
+                data = result_type.model_validate(tool_use.input).to_dict()
+                break
+            except RESULT_ERRORS as e:
+                # A truncated result would be truncated again on a re-ask
+                if message.stop_reason == "max_tokens":
+                    get_logger().error(f"Truncated result from Claude: {e}")
+                    raise InvalidResultError("Claude response was truncated at max_tokens") from e
+                # Re-ask once with the error (as the tool result when there was a
+                # tool call); a second failure propagates to the caller
+                if len(messages) > 1:
+                    get_logger().error(f"Invalid result from Claude: {e}")
+                    raise
+                get_logger().warning("Re-asking Claude for a result matching the schema")
+                if message.content:
+                    messages.append({"role": "assistant", "content": message.content})
+                if tool_use is None:
+                    messages.append({"role": "user", "content": SCHEMA_REASK_PROMPT.format(error=e)})
+                else:
+                    messages.append({
+                        "role": "user",
+                        "content": [{
+                            "type": "tool_result",
+                            "tool_use_id": tool_use.id,
+                            "is_error": True,
+                            "content": SCHEMA_REASK_PROMPT.format(error=e)
+                        }]
+                    })
+
+        return data
+
+
+class OpenAIProvider(AIProvider):
+    """OpenAI (GPT) AI provider."""
+
+    # Also covers truncated (LengthFinishReasonError) responses
+    api_errors = (openai.OpenAIError,)
+
+    def __init__(
+        self,
+        api_key: str,
+        model: Optional[str] = None,
+        max_concurrent: int = 5,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        sync_http_client: Optional[httpx.Client] = None
+    ):
+        super().__init__(max_concurrent, rate_limiter, response_cache)
+        self.client = OpenAI(api_key=api_key, max_retries=SYNC_CLIENT_MAX_RETRIES, http_client=sync_http_client)
+        # Retries are handled by retry_async, so disable the SDK's own retry loop
+        self.aclient = AsyncOpenAI(api_key=api_key, max_retries=0, http_client=http_client)
+        # Structured Outputs require gpt-4o-2024-08-06 or newer
+        self.model = model or "gpt-4o"
+
+    async def _chat(self, system_prompt: str, prompt: str, result_type: type, max_tokens: int) -> Dict:
+        """Stream a Structured Outputs response for the prompts and convert it to a dict."""
+        async def stream_completion() -> BaseModel:
+            await self.rate_limiter.acquire(estimate_request_tokens(system_prompt, prompt, max_tokens))
+
+            # Structured Outputs: the SDK validates the streamed JSON against the schema
+            async with self.aclient.beta.chat.completions.stream(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that organizes podcast collections. Always respond with valid JSON only."},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
-                response_format={"type": "json_object"}
-            )
+                response_format=result_type,
+                max_completion_tokens=max_tokens
+            ) as stream:
+                completion = await stream.get_final_completion()
 
-            # Parse JSON response
-            content = response.choices[0].message.content
-            return self._parse_response(content, podcasts)
+            message = completion.choices[0].message
+            # A refusal (or an empty response) comes back without a parsed result
+            if message.parsed is None:
+                raise InvalidResultError(f"OpenAI returned no result: {message.refusal or 'empty response'}")
+            return message.parsed
 
-        except Exception as e:
+        try:
+            result = await retry_async(stream_completion, OPENAI_RETRYABLE_ERRORS)
+        except openai.APIError as e:
             logger = get_logger()
             logger.error(f"Error calling OpenAI API: {e}")
             raise
 
-    def _build_prompt(self, podcast_list: List[Dict]) -> str:
-        """Build categorization prompt for OpenAI (uses tags for improved accuracy)."""
-        podcasts_json = json.dumps(podcast_list, indent=2)
+        return result.to_dict()
+
+
+class BatchAPIProvider(AIProvider):
+    """
+    Base for providers that run each pass as one provider batch job.
 
-        return f"""You are helping organize a podcast collection. I have {len(podcast_list)} podcasts that need to be categorized.
+    Subclasses implement _run_batch; it runs in a worker thread because the
+    job is submitted and polled with the blocking client.
+    """
 
-Here are the podcasts with their AI-generated tags:
+    @abstractmethod
+    def _run_batch(
+        self,
+        prompts: List[str],
+        system_prompt: str,
+        result_type: type,
+        max_tokens: int
+    ) -> List[Optional[Dict]]:
+        """
+        Submit prompts as one batch job and collect the parsed responses.
 
-{podcasts_json}
+        Args:
+            prompts: User prompts, one request each
+            system_prompt: System prompt shared by all requests
+            result_type: Result model the responses must match
+            max_tokens: Response token limit per request
 
-Please analyze these podcasts and:
-1. Create logical category groupings (e.g., "Technology & AI", "Business & Entrepreneurship", "News & Politics", "Health & Wellness", etc.)
-2. Assign each podcast to ONE category based on its title, description, and tags (tags provide semantic signals about the podcast's themes)
-3. Use clear, descriptive category names that reflect the common themes
+        Returns:
+            Parsed response for each prompt (None if that request failed)
+        """
+        pass
 
-Return your response as a JSON object with this structure:
+    async def enrich_podcasts(
+        self,
+        podcasts: List[PodcastMetadata],
+        batch_size: int = 30,
+        known_categories: Sequence[str] = ()
+    ) -> Dict:
+        """Categorize podcasts through a single batch job."""
+        offsets = range(0, len(podcasts), batch_size)
+        prompts = [
+            self._build_categorize_prompt(podcasts[offset:offset + batch_size], known_categories)
+            for offset in offsets
+        ]
+        results = await asyncio.to_thread(self._run_batch, prompts, CATEGORIZE_SYSTEM_PROMPT, CategorizationResult, 8000)
+        return {"categories": self._merge_categories(offsets, results)}
+
+    async def enrich_and_tag_podcasts(self, podcasts: List[PodcastMetadata], batch_size: int = 30) -> Dict:
+        """Categorize and tag podcasts through a single batch job."""
+        offsets = range(0, len(podcasts), batch_size)
+        prompts = [
+            self._build_prompt(self._build_enrich_list(podcasts[offset:offset + batch_size]))
+            for offset in offsets
+        ]
+
+        categories: Dict[str, List[int]] = {}
+        tags: Dict[str, List[str]] = {}
+        results = await asyncio.to_thread(self._run_batch, prompts, ENRICH_SYSTEM_PROMPT, EnrichmentResult, 8000)
+        for offset, shard_data in zip(offsets, results):
+            self._merge_enriched_shard(categories, tags, offset, shard_data)
+
+        return {"categories": categories, "tags": tags}
+
+    async def generate_tags_batch(self, podcasts: List[PodcastMetadata]) -> Dict:
+        """Generate tags through a single batch job."""
+        prompts = [
+            self._build_prompt(self._build_tag_list(podcasts[start:end], start_id=start))
+            for start, end in self._pack_tag_batches(podcasts)
+        ]
 
-{{
-  "categories": {{
-    "Technology & AI": [0, 1, 5, 8, 12],
-    "Business & Entrepreneurship": [2, 3, 4],
-    "News & Politics": [6, 7, 9]
-  }}
-}}
+        all_tags = {}
+        for batch_tags in await asyncio.to_thread(self._run_batch, prompts, TAG_SYSTEM_PROMPT, TagResult, TAG_MAX_OUTPUT_TOKENS):
+            if batch_tags and "tags" in batch_tags:
+                all_tags.update(batch_tags["tags"])
 
-IMPORTANT:
-- Include ALL podcast IDs (0 through {len(podcast_list)-1}) in the categories
-- Each podcast must be assigned to exactly ONE category
-- Pay attention to the tags - they often reveal the true theme of a podcast
+        return {"tags": all_tags}
 
-Use the podcast IDs (0, 1, 2, etc.) to reference podcasts."""
+    async def generate_tags_stream(
+        self,
+        podcasts: AsyncIterable[PodcastMetadata],
+        expected_count: Optional[int] = None
+    ) -> Dict:
+        """Collect the stream, then generate tags through a single batch job."""
+        return await self.generate_tags_batch([podcast async for podcast in podcasts])
 
-    def _parse_response(self, content: str, podcasts: List[PodcastMetadata]) -> Dict:
-        """Parse OpenAI's JSON response."""
-        try:
-            data = json.loads(content)
-            return data
-        except json.JSONDecodeError as e:
-            logger = get_logger()
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.warning(f"Response: {content}")
-            raise
 
-    def generate_tags_batch(self, podcasts: List[PodcastMetadata], batch_size: int = 25) -> Dict:
-        """Generate tags for podcasts in batches using OpenAI."""
-        all_tags = {}
+class BatchClaudeProvider(BatchAPIProvider, ClaudeProvider):
+    """
+    Claude provider using the Message Batches API.
+
+    All requests of a pass are submitted as one batch job and polled until it
+    ends. Batches cost ~50% less and have higher rate limits, but can take up
+    to 24 hours, so this mode suits scheduled (e.g. nightly) runs.
+    """
 
-        # Process in batches
-        for i in range(0, len(podcasts), batch_size):
-            batch = podcasts[i:i + batch_size]
-            batch_data = [
+    def _run_batch(
+        self,
+        prompts: List[str],
+        system_prompt: str,
+        result_type: type,
+        max_tokens: int
+    ) -> List[Optional[Dict]]:
+        """Submit prompts as one Message Batches job with forced tool use."""
+        logger = get_logger()
+        results: List[Optional[Dict]] = [self._cached_response(system_prompt, prompt) for prompt in prompts]
+        pending = [i for i, data in enumerate(results) if data is None]
+        if not pending:
+            return results
+
+        batch = self.client.beta.messages.batches.create(
+            requests=[
                 {
-                    "id": i + j,
-                    "title": p.display_title,
-                    "category": p.category or "Uncategorized",
-                    "description": (p.description or "")[:200]
+                    "custom_id": str(i),
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": max_tokens,
+                        "system": self._system_blocks(system_prompt),
+                        "messages": [{"role": "user", "content": prompts[i]}],
+                        "tools": [self._result_tool(result_type)],
+                        "tool_choice": {"type": "tool", "name": RESULT_TOOL_NAME}
+                    }
                 }
-                for j, p in enumerate(batch)
+                for i in pending
             ]
+        )
+        logger.verbose_info(f"Submitted Claude batch {batch.id} with {len(pending)} request(s)")
+
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.client.beta.messages.batches.retrieve(batch.id)
+            logger.verbose_info(f"Batch {batch.id}: {batch.processing_status}")
+
+        counts = batch.request_counts
+        logger.verbose_info(
+            f"Batch {batch.id} ended: {counts.succeeded} succeeded, {counts.errored} errored, "
+            f"{counts.canceled} canceled, {counts.expired} expired"
+        )
+
+        for entry in self.client.beta.messages.batches.results(batch.id):
+            i = int(entry.custom_id)
+            if entry.result.type != "succeeded":
+                logger.warning(f"Warning: Batch request {i + 1} {entry.result.type}")
+                continue
+            tool_use = next((block for block in entry.result.message.content if block.type == "tool_use"), None)
+            if tool_use is None:
+                logger.warning(f"Warning: Batch request {i + 1} returned no result")
+                continue
+            try:
+                data = result_type.model_validate(tool_use.input).to_dict()
+            except ValidationError as e:
+                logger.warning(f"Warning: Batch request {i + 1} returned an invalid result: {e}")
+                continue
+            self._cache_response(data, system_prompt, prompts[i])
+            results[i] = data
 
-            prompt = self._build_tag_prompt(batch_data)
+        return results
 
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that generates relevant tags for podcasts. Always respond with valid JSON only."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    response_format={"type": "json_object"}
-                )
 
-                content = response.choices[0].message.content
-                batch_tags = self._parse_response(content, batch)
+class BatchOpenAIProvider(BatchAPIProvider, OpenAIProvider):
+    """
+    OpenAI provider using the Batch API.
 
-                # Merge batch results
-                if "tags" in batch_tags:
-                    all_tags.update(batch_tags["tags"])
+    All requests of a pass are uploaded as one JSONL file, run as a batch job
+    and polled until it finishes. Batches cost ~50% less and have higher rate
+    limits, but can take up to 24 hours, so this mode suits scheduled runs.
+    """
 
-            except Exception as e:
-                logger = get_logger()
-                logger.warning(f"Warning: Failed to generate tags for batch {i//batch_size + 1}: {e}")
+    def _run_batch(
+        self,
+        prompts: List[str],
+        system_prompt: str,
+        result_type: type,
+        max_tokens: int
+    ) -> List[Optional[Dict]]:
+        """Submit prompts as one Batch API job with Structured Outputs."""
+        logger = get_logger()
+        results: List[Optional[Dict]] = [self._cached_response(system_prompt, prompt) for prompt in prompts]
+        pending = [i for i, data in enumerate(results) if data is None]
+        if not pending:
+            return results
+
+        response_format = json_schema_format(result_type)
+        lines = [
+            encode_compact({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompts[i]}
+                    ],
+                    "response_format": response_format,
+                    "max_completion_tokens": max_tokens
+                }
+            })
+            for i in pending
+        ]
+        input_file = self.client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.verbose_info(f"Submitted OpenAI batch {batch.id} with {len(pending)} request(s)")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
+            logger.verbose_info(f"Batch {batch.id}: {batch.status}")
+
+        if not batch.output_file_id:
+            logger.warning(f"Warning: Batch {batch.id} {batch.status} without output")
+            return results
+
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
                 continue
+            entry = loads_json(line)
+            i = int(entry["custom_id"])
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                logger.warning(f"Warning: Batch request {i + 1} failed: {entry.get('error')}")
+                continue
+            try:
+                data = result_type.model_validate_json(response["body"]["choices"][0]["message"]["content"]).to_dict()
+            except ValidationError as e:
+                logger.warning(f"Warning: Batch request {i + 1} returned an invalid result: {e}")
+                continue
+            self._cache_response(data, system_prompt, prompts[i])
+            results[i] = data
 
-        return {"tags": all_tags}
+        return results
 
-    def _build_tag_prompt(self, podcast_list: List[Dict]) -> str:
-        """Build tag generation prompt for OpenAI."""
-        podcasts_json = json.dumps(podcast_list, indent=2)
 
-        return f"""Generate 3-5 relevant tags for each of these {len(podcast_list)} podcasts.
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the HTTP/2 client shared by all async API requests.
 
-Podcasts:
-{podcasts_json}
+    Concurrent shard requests are multiplexed over pooled keep-alive
+    connections instead of each paying for a new TLS handshake.
 
-For each podcast, create tags that:
-1. Reflect the podcast's category and topic
-2. Include relevant keywords from the title
-3. Are concise (1-2 words each)
-4. Are lowercase without # symbol
-5. Use dashes to join multi-word tags (e.g., "venture-capital" not "venture capital")
+    Returns:
+        httpx.AsyncClient instance
+    """
+    return httpx.AsyncClient(http2=True, limits=HTTP_CLIENT_LIMITS)
 
-Return JSON in this format:
-{{
-  "tags": {{
-    "0": ["technology", "business", "venture-capital"],
-    "1": ["news", "politics", "world-affairs"]
-  }}
-}}
 
-Include ALL podcast IDs (0 through {len(podcast_list)-1})."""
+def create_sync_http_client() -> httpx.Client:
+    """
+    Create the HTTP/2 client shared by the blocking Batch API requests.
+
+    Batch submission, polling and result downloads run in worker threads;
+    sharing one pooled client keeps them on the same warm connections.
+
+    Returns:
+        httpx.Client instance
+    """
+    return httpx.Client(http2=True, limits=HTTP_CLIENT_LIMITS)
 
 
-def create_ai_provider(config: AIConfig) -> AIProvider:
+def create_ai_provider(config: AIConfig, response_cache: Optional[ResponseCache] = None) -> AIProvider:
     """
     Factory function to create appropriate AI provider.
 
     Args:
         config: AI configuration
+        response_cache: Optional cache of parsed AI responses
 
     Returns:
         AIProvider instance
@@ -374,36 +1231,77 @@ def create_ai_provider(config: AIConfig) -> AIProvider:
     Raises:
         ValueError: If provider is invalid or API key is missing
     """
-    provider = config.provider.lower()
+    provider = config.provider
+    use_batch_api = config.batch_mode == "batch"
 
+    # Validate before creating the HTTP clients, so an error leaves nothing open
     if provider == "claude":
         if not config.anthropic_api_key:
             raise ValueError("Anthropic API key not configured")
-        return ClaudeProvider(config.anthropic_api_key, config.model)
+        provider_class = BatchClaudeProvider if use_batch_api else ClaudeProvider
+        api_key = config.anthropic_api_key
 
     elif provider == "openai":
         if not config.openai_api_key:
             raise ValueError("OpenAI API key not configured")
-        return OpenAIProvider(config.openai_api_key, config.model)
+        provider_class = BatchOpenAIProvider if use_batch_api else OpenAIProvider
+        api_key = config.openai_api_key
 
     else:
         raise ValueError(f"Unknown AI provider: {provider}")
 
+    rate_limiter = RateLimiter(config.max_requests_per_minute, config.max_tokens_per_minute)
+    http_client = create_http_client()
+    # Only the Batch API providers make blocking requests
+    sync_http_client = create_sync_http_client() if use_batch_api else None
+
+    return provider_class(api_key, config.model, config.max_concurrent, rate_limiter, response_cache, http_client, sync_http_client)
+
 
 def enrich_podcasts_with_ai(
     podcasts: List[PodcastMetadata],
     config: AIConfig,
     output_file: str = "podcasts.md",
-    verbose: bool = False
+    verbose: bool = False,
+    use_cache: bool = True
+) -> List[PodcastMetadata]:
+    """
+    Synchronous wrapper for enrich_podcasts_with_ai_async.
+
+    Args:
+        podcasts: List of PodcastMetadata objects
+        config: AI configuration
+        output_file: Output markdown filename (used to derive JSON filename)
+        verbose: Show verbose output
+        use_cache: Reuse cached AI responses for unchanged requests
+
+    Returns:
+        List of enriched PodcastMetadata objects
+    """
+    return asyncio.run(
+        enrich_podcasts_with_ai_async(podcasts, config, output_file, verbose, use_cache)
+    )
+
+
+async def enrich_podcasts_with_ai_async(
+    podcasts: List[PodcastMetadata],
+    config: AIConfig,
+    output_file: str = "podcasts.md",
+    verbose: bool = False,
+    use_cache: bool = True
 ) -> List[PodcastMetadata]:
     """
     Enrich podcasts with AI-generated categories and tags.
 
+    Async callers should await this directly instead of using the
+    synchronous wrapper, which starts a new event loop per call.
+
     Args:
         podcasts: List of PodcastMetadata objects
         config: AI configuration
         output_file: Output markdown filename (used to derive JSON filename)
         verbose: Show verbose output
+        use_cache: Reuse cached AI responses for unchanged requests
 
     Returns:
         List of enriched PodcastMetadata objects
@@ -411,84 +1309,386 @@ def enrich_podcasts_with_ai(
     if not podcasts:
         return podcasts
 
-    # Filter out podcasts without metadata
-    valid_podcasts = [p for p in podcasts if p.has_metadata]
-    failed_podcasts = [p for p in podcasts if not p.has_metadata]
+    response_cache = ResponseCache() if use_cache else None
+    podcast_cache = PodcastCache() if use_cache else None
+    try:
+        provider = create_ai_provider(config, response_cache)
+        try:
+            return await _enrich_podcasts(podcasts, provider, podcast_cache, config, output_file, verbose)
+        finally:
+            await provider.aclose()
+    finally:
+        _close_caches(response_cache, podcast_cache)
+
+
+def enrich_podcast_stream_with_ai(
+    podcasts: AsyncIterable[Tuple[int, PodcastMetadata]],
+    config: AIConfig,
+    output_file: str = "podcasts.md",
+    verbose: bool = False,
+    use_cache: bool = True,
+    expected_count: Optional[int] = None
+) -> List[PodcastMetadata]:
+    """
+    Synchronous wrapper for enrich_podcast_stream_with_ai_async.
+
+    Args:
+        podcasts: (index, PodcastMetadata) pairs, e.g. from fetch_rss_metadata_stream
+        config: AI configuration
+        output_file: Output markdown filename (used to derive JSON filename)
+        verbose: Show verbose output
+        use_cache: Reuse cached AI responses for unchanged requests
+        expected_count: Approximate number of podcasts in the stream (sizes tag batches)
+
+    Returns:
+        List of enriched PodcastMetadata objects, in index order
+    """
+    return asyncio.run(
+        enrich_podcast_stream_with_ai_async(podcasts, config, output_file, verbose, use_cache, expected_count)
+    )
+
+
+async def enrich_podcast_stream_with_ai_async(
+    podcasts: AsyncIterable[Tuple[int, PodcastMetadata]],
+    config: AIConfig,
+    output_file: str = "podcasts.md",
+    verbose: bool = False,
+    use_cache: bool = True,
+    expected_count: Optional[int] = None
+) -> List[PodcastMetadata]:
+    """
+    Enrich podcasts with AI while their RSS feeds are still being fetched.
+
+    Pass 1 tag requests start as soon as a batch of fetched podcasts is
+    ready, so the AI works during the fetch instead of after it. Pass 2
+    needs the whole collection and runs once the stream ends. Single-pass
+    and Batch API modes submit the whole collection at once, so they just
+    collect the stream first.
+
+    Args:
+        podcasts: (index, PodcastMetadata) pairs, e.g. from fetch_rss_metadata_stream
+        config: AI configuration
+        output_file: Output markdown filename (used to derive JSON filename)
+        verbose: Show verbose output
+        use_cache: Reuse cached AI responses for unchanged requests
+        expected_count: Approximate number of podcasts in the stream (sizes tag batches)
+
+    Returns:
+        List of enriched PodcastMetadata objects, in index order
+    """
+    response_cache = ResponseCache() if use_cache else None
+    podcast_cache = PodcastCache() if use_cache else None
+    try:
+        provider = create_ai_provider(config, response_cache)
+        try:
+            stream_tagged: List[PodcastMetadata] = []
+            if config.single_pass or config.batch_mode == "batch":
+                collected = {index: podcast async for index, podcast in podcasts}
+                collected = [collected[index] for index in sorted(collected)]
+            else:
+                collected, stream_tagged = await _tag_while_fetching(
+                    podcasts, provider, podcast_cache, expected_count, config.use_itunes_categories
+                )
+
+            if not collected:
+                return collected
+            return await _enrich_podcasts(
+                collected, provider, podcast_cache, config, output_file, verbose, stream_tagged
+            )
+        finally:
+            await provider.aclose()
+    finally:
+        _close_caches(response_cache, podcast_cache)
+
+
+def _close_caches(response_cache: Optional[ResponseCache], podcast_cache: Optional[PodcastCache]) -> None:
+    """Close the run's cache connections (either may be None)."""
+    for cache in (response_cache, podcast_cache):
+        if cache is not None:
+            cache.close()
+
+
+async def _tag_while_fetching(
+    podcasts: AsyncIterable[Tuple[int, PodcastMetadata]],
+    provider: AIProvider,
+    podcast_cache: Optional[PodcastCache],
+    expected_count: Optional[int] = None,
+    use_itunes_categories: bool = False
+) -> Tuple[List[PodcastMetadata], List[PodcastMetadata]]:
+    """
+    Collect podcasts from a fetch stream, tagging them in batches as they arrive.
+
+    Podcasts with cached results get their category and tags right away; the
+    rest are streamed to provider.generate_tags_stream, which sends each
+    token-budgeted batch while later feeds still download. Podcasts of a
+    failed batch stay untagged and are retried by Pass 1.
+
+    Args:
+        podcasts: (index, PodcastMetadata) pairs in completion order
+        provider: AI provider used for tagging
+        podcast_cache: Optional cache of per-podcast results
+        expected_count: Approximate number of podcasts in the stream
+        use_itunes_categories: Apply feed categories before tagging; those
+            podcasts are complete once tagged
+
+    Returns:
+        All podcasts from the stream in index order, and the podcasts the AI tagged
+    """
+    collected: Dict[int, PodcastMetadata] = {}
+    tag_targets: List[PodcastMetadata] = []
+
+    async def podcasts_to_tag() -> AsyncIterator[PodcastMetadata]:
+        async for index, podcast in podcasts:
+            collected[index] = podcast
+            if not podcast.has_metadata or podcast.tags:
+                continue
+
+            if podcast_cache is not None:
+                key = podcast_cache_key(podcast.display_title, podcast.description)
+                cached_result = (await asyncio.to_thread(podcast_cache.get_many, [key])).get(key)
+                if cached_result:
+                    podcast.category, podcast.tags = cached_result
+                    continue
+
+            if use_itunes_categories and podcast.itunes_category:
+                podcast.category = podcast.itunes_category
+
+            tag_targets.append(podcast)
+            yield podcast
+
+    tag_data = await provider.generate_tags_stream(podcasts_to_tag(), expected_count)
+
+    ai_tags_generated = tag_data.get("tags", {})
+    ai_tagged = []
+    for i, podcast in enumerate(tag_targets):
+        ai_tags = ai_tags_generated.get(str(i))
+        if ai_tags:
+            podcast.tags = deduplicate_tags(ai_tags)
+            ai_tagged.append(podcast)
+
+    if podcast_cache is not None:
+        # Feed-categorized podcasts are complete and skip both passes
+        await asyncio.to_thread(podcast_cache.set_many, [
+            (podcast_cache_key(p.display_title, p.description), p.category, p.tags)
+            for p in ai_tagged
+            if p.category
+        ])
+
+    return [collected[index] for index in sorted(collected)], ai_tagged
+
+
+async def _enrich_podcasts(
+    podcasts: List[PodcastMetadata],
+    provider: AIProvider,
+    podcast_cache: Optional[PodcastCache],
+    config: AIConfig,
+    output_file: str,
+    verbose: bool,
+    stream_tagged: Sequence[PodcastMetadata] = ()
+) -> List[PodcastMetadata]:
+    """
+    Run both AI passes over a collection and save the enrichment JSON.
+
+    Args:
+        podcasts: List of PodcastMetadata objects
+        provider: AI provider
+        podcast_cache: Optional cache of per-podcast results
+        config: AI configuration
+        output_file: Output markdown filename (used to derive JSON filename)
+        verbose: Show verbose output
+        stream_tagged: Podcasts the AI already tagged while their feeds were fetched
+
+    Returns:
+        The same podcasts, enriched in place and in their original order
+    """
+    # Podcasts without metadata are skipped; podcasts enriched on a previous
+    # run keep their category and tags. Only the rest are sent to the AI
+    # (IDs are numbered within this subset)
+    enriched_podcasts = []
+    valid_podcasts = []
+    for podcast in podcasts:
+        if podcast.has_metadata:
+            (enriched_podcasts if podcast.category and podcast.tags else valid_podcasts).append(podcast)
 
     logger = get_logger()
 
-    if not valid_podcasts:
+    if not (enriched_podcasts or valid_podcasts):
         logger.warning("No valid podcasts to enrich")
         return podcasts
 
-    # Create AI provider
-    provider = create_ai_provider(config)
+    if enriched_podcasts and verbose:
+        logger.info(f"Skipping {len(enriched_podcasts)} podcasts that already have a category and tags")
 
-    # PASS 1: Tag Generation (provides semantic signals for better categorization)
-    if verbose:
-        logger.info(f"Pass 1: Generating AI tags in batches with {config.provider}...")
+    # Podcasts whose title and description are unchanged reuse cached results
+    if podcast_cache is not None and valid_podcasts:
+        cache_keys = [podcast_cache_key(p.display_title, p.description) for p in valid_podcasts]
+        cached_results = await asyncio.to_thread(podcast_cache.get_many, cache_keys)
+
+        uncached = []
+        for podcast, key in zip(valid_podcasts, cache_keys):
+            if key in cached_results:
+                podcast.category, podcast.tags = cached_results[key]
+                enriched_podcasts.append(podcast)
+            else:
+                uncached.append(podcast)
+
+        if cached_results and verbose:
+            logger.info(f"Reusing cached AI results for {len(valid_podcasts) - len(uncached)} unchanged podcasts")
+        valid_podcasts = uncached
+
+    # The enrichment JSON keys podcasts by feed URL; podcasts tagged while
+    # their feeds were fetched are recorded along with this run's Pass 1
+    ai_tags_by_url = {podcast.xml_url: podcast.tags for podcast in stream_tagged}
+
+    if not valid_podcasts:
+        _save_enrichment_json(output_file, {
+            "categories": {},
+            "ai_tags": ai_tags_by_url,
+            "stats": {
+                "total_podcasts": 0,
+                "already_enriched": len(enriched_podcasts),
+                "categories": 0,
+                "feed_categorized": 0,
+                "ai_tagged": 0,
+                "auto_tagged": 0
+            }
+        }, verbose)
+        return podcasts
+
+    # Feed categories are applied before Pass 1 (tag prompts show each
+    # podcast's category); those podcasts skip Pass 2
+    feed_categorized = []
+    if config.use_itunes_categories and not config.single_pass:
+        feed_categorized = [p for p in valid_podcasts if p.itunes_category]
+        for podcast in feed_categorized:
+            podcast.category = podcast.itunes_category
+    feed_categorized_ids = {id(podcast) for podcast in feed_categorized}
+    categorize_targets = [p for p in valid_podcasts if id(p) not in feed_categorized_ids]
+
+    # Podcasts already tagged while their feeds were being fetched skip Pass 1
+    tag_targets = valid_podcasts if config.single_pass else [p for p in valid_podcasts if not p.tags]
+
+    # Fallback tags from title keywords (no category yet) are generated
+    # speculatively in a worker thread while the AI requests are in flight;
+    # only podcasts the AI leaves untagged use them
+    fallback_tags = asyncio.create_task(asyncio.to_thread(
+        generate_tags_for_podcasts_batch,
+        [("", podcast.display_title) for podcast in tag_targets],
+        max_total_tags=5
+    ))
+
+    if config.single_pass:
+        # Single pass: one request per batch returns both categories and tags
+        if verbose:
+            logger.info(f"Categorizing and tagging {len(valid_podcasts)} podcasts in one pass with {config.provider}...")
+
+        enrichment_data = await provider.enrich_and_tag_podcasts(valid_podcasts, batch_size=config.batch_size)
+        tag_data = {"tags": enrichment_data.pop("tags")}
+    else:
+        # PASS 1: Tag Generation (provides semantic signals for better categorization)
+        if verbose:
+            logger.info(f"Pass 1: Generating AI tags in batches with {config.provider}...")
 
-    tag_data = provider.generate_tags_batch(valid_podcasts, batch_size=25)
+        tag_data = await provider.generate_tags_batch(tag_targets)
     ai_tags_generated = tag_data.get("tags", {})
 
-    # Apply AI-generated tags (normalize to use dashes)
-    num_ai_tagged = 0
-    for i, podcast in enumerate(valid_podcasts):
+    # Apply AI-generated tags (normalize to use dashes), falling back to
+    # auto-generated tags where the AI didn't provide any
+    auto_tags = await fallback_tags
+    untagged = []
+    for i, podcast in enumerate(tag_targets):
         ai_tags = ai_tags_generated.get(str(i), [])
         if ai_tags:
             # Normalize AI tags to ensure dashes instead of spaces
             podcast.tags = deduplicate_tags(ai_tags)
-            num_ai_tagged += 1
+            ai_tags_by_url[podcast.xml_url] = podcast.tags
         else:
-            # Fallback to auto-generated tags if AI didn't provide
-            auto_tags = generate_tags_for_podcast(
-                category="",  # No category yet
-                title=podcast.display_title,
-                max_total_tags=5
-            )
             # Auto-generated tags are already normalized via deduplicate_tags
-            podcast.tags = deduplicate_tags(auto_tags)
+            podcast.tags = deduplicate_tags(auto_tags[i])
+            untagged.append(podcast)
+    num_ai_tagged = len(valid_podcasts) - len(untagged)
 
     if verbose:
         logger.success(f"AI-generated tags for {num_ai_tagged}/{len(valid_podcasts)} podcasts")
         if num_ai_tagged < len(valid_podcasts):
             logger.success(f"Auto-generated tags for remaining {len(valid_podcasts) - num_ai_tagged} podcasts")
 
-    # PASS 2: Categorization (using tags for improved accuracy)
-    if verbose:
-        logger.info(f"Pass 2: Categorizing {len(valid_podcasts)} podcasts using tags...")
+    if not config.single_pass:
+        # PASS 2: Categorization (using tags for improved accuracy)
+        if verbose:
+            if feed_categorized:
+                logger.info(f"Using feed categories for {len(feed_categorized)} podcasts")
+            logger.info(f"Pass 2: Categorizing {len(categorize_targets)} podcasts using tags (max {config.max_concurrent} concurrent requests)...")
+
+        enrichment_data = await provider.enrich_podcasts(
+            categorize_targets,
+            batch_size=config.batch_size,
+            known_categories=sorted({podcast.category for podcast in feed_categorized})
+        )
 
-    enrichment_data = provider.enrich_podcasts(valid_podcasts)
     categories = enrichment_data.get("categories", {})
 
-    # Apply categories from category mapping
-    for category, podcast_ids in categories.items():
-        for podcast_id in podcast_ids:
-            if podcast_id < len(valid_podcasts):
-                valid_podcasts[podcast_id].category = category
+    # Apply categories in one pass over the podcasts via an ID -> category map
+    # (IDs the model invented beyond the collection are simply never looked up)
+    id_to_category = {
+        podcast_id: category
+        for category, podcast_ids in categories.items()
+        for podcast_id in podcast_ids
+    }
+    categorized_ids = set(feed_categorized_ids)
+    categories_by_url: Dict[str, List[str]] = {}
+    for i, podcast in enumerate(categorize_targets):
+        if i in id_to_category:
+            podcast.category = id_to_category[i]
+            categorized_ids.add(id(podcast))
+            categories_by_url.setdefault(podcast.category, []).append(podcast.xml_url)
+
+    if podcast_cache is not None:
+        # Only complete results are cached, so fallbacks are retried next run
+        auto_tagged = {id(podcast) for podcast in untagged}
+        await asyncio.to_thread(podcast_cache.set_many, [
+            (podcast_cache_key(podcast.display_title, podcast.description), podcast.category, podcast.tags)
+            for podcast in valid_podcasts
+            if id(podcast) in categorized_ids and id(podcast) not in auto_tagged
+        ])
 
     if verbose:
-        logger.success(f"Created {len(categories)} categories")
-        for cat, podcast_ids in categories.items():
-            logger.print(f"    - {cat}: {len(podcast_ids)} podcasts")
+        logger.success(f"Created {len(categories_by_url)} categories")
+        for cat, xml_urls in categories_by_url.items():
+            logger.print(f"    - {cat}: {len(xml_urls)} podcasts")
 
     # Save combined enrichment data to JSON
-    enrichment_data["ai_tags"] = ai_tags_generated
-    enrichment_data["stats"] = {
-        "total_podcasts": len(valid_podcasts),
-        "categories": len(categories),
-        "ai_tagged": num_ai_tagged,
-        "auto_tagged": len(valid_podcasts) - num_ai_tagged
-    }
+    _save_enrichment_json(output_file, {
+        "categories": categories_by_url,
+        "ai_tags": ai_tags_by_url,
+        "stats": {
+            "total_podcasts": len(valid_podcasts),
+            "already_enriched": len(enriched_podcasts),
+            "categories": len(categories_by_url),
+            "feed_categorized": len(feed_categorized),
+            "ai_tagged": num_ai_tagged,
+            "auto_tagged": len(valid_podcasts) - num_ai_tagged
+        }
+    }, verbose)
+
+    # Combine previously enriched, newly enriched and failed podcasts
+    return podcasts
+
+
+def _save_enrichment_json(output_file: str, enrichment_data: Dict, verbose: bool) -> None:
+    """
+    Save a run's enrichment data next to the markdown output.
 
+    Args:
+        output_file: Output markdown filename (the JSON is saved as <output_file>.json)
+        enrichment_data: "categories" (name -> feed URLs), "ai_tags" (feed URL -> tags) and "stats"
+        verbose: Show verbose output
+    """
+    logger = get_logger()
     json_file = f"{output_file}.json"
     try:
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(enrichment_data, f, indent=2, ensure_ascii=False)
+        Path(json_file).write_bytes(encode_indented(enrichment_data))
         if verbose:
             logger.success(f"Saved enrichment data to: {json_file}")
-    except Exception as e:
+    except OSError as e:
         logger.warning(f"Warning: Could not save JSON response: {e}")
-
-    # Combine valid and failed podcasts
-    return valid_podcasts + failed_podcasts
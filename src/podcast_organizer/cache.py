@@ -0,0 +1,239 @@
+"""Disk-backed caches for podcast organizer."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "podcast-organizer"
+
+# Keys per SELECT ... IN (...) query (stays under SQLite's host parameter limit)
+LOOKUP_CHUNK_SIZE = 500
+
+
+def response_cache_key(model: str, *prompts: str) -> str:
+    """
+    Build a cache key for an AI request.
+
+    Args:
+        model: Model name
+        prompts: Prompt strings sent with the request (system, user, ...)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = "\0".join((model, *prompts))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite cache of parsed AI responses, keyed by model and prompt.
+
+    Re-running on an unchanged collection returns the stored responses
+    instead of calling the API again. One connection is kept open for the
+    run; callers on the event loop use it through asyncio.to_thread, so it
+    is shared across worker threads behind a lock. Call close() when done.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize response cache.
+
+        Args:
+            path: SQLite database file (default: ~/.cache/podcast-organizer/ai_responses.db)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR / "ai_responses.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from response_cache_key()
+
+        Returns:
+            Parsed response data, or None on a cache miss
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM responses WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, data: Dict) -> None:
+        """
+        Store a parsed response.
+
+        Args:
+            key: Key from response_cache_key()
+            data: Parsed response data
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, data) VALUES (?, ?)",
+                (key, json.dumps(data, ensure_ascii=False))
+            )
+
+
+def podcast_cache_key(title: str, description: Optional[str]) -> str:
+    """
+    Build a cache key from a podcast's content.
+
+    Args:
+        title: Podcast display title
+        description: Podcast description (may be None)
+
+    Returns:
+        Hex digest that changes when the title or description changes
+    """
+    payload = f"{title}\0{description or ''}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PodcastCache:
+    """
+    SQLite cache of AI enrichment results per podcast, keyed by content.
+
+    Podcasts whose title and description are unchanged since a previous run
+    reuse their stored category and tags instead of being sent to the AI.
+    Like ResponseCache, it keeps one connection open for the run, shared
+    across worker threads behind a lock. Call close() when done.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize podcast cache.
+
+        Args:
+            path: SQLite database file (default: ~/.cache/podcast-organizer/podcasts.db)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR / "podcasts.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS podcasts "
+                "(key TEXT PRIMARY KEY, category TEXT NOT NULL, tags TEXT NOT NULL)"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Look up cached results for several podcasts.
+
+        Args:
+            keys: Keys from podcast_cache_key()
+
+        Returns:
+            Dict mapping each cached key to its (category, tags); misses are omitted
+        """
+        results = {}
+        with self._lock:
+            for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+                chunk = keys[i:i + LOOKUP_CHUNK_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT key, category, tags FROM podcasts WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                for key, category, tags in rows:
+                    results[key] = (category, json.loads(tags))
+        return results
+
+    def set_many(self, entries: Iterable[Tuple[str, str, List[str]]]) -> None:
+        """
+        Store results for several podcasts.
+
+        Args:
+            entries: (key, category, tags) tuples
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO podcasts (key, category, tags) VALUES (?, ?, ?)",
+                ((key, category, json.dumps(tags, ensure_ascii=False)) for key, category, tags in entries)
+            )
+
+
+class FeedCache:
+    """
+    SQLite cache of RSS feed validators and parsed metadata, keyed by feed URL.
+
+    Feeds are re-requested with If-None-Match / If-Modified-Since; a 304 Not
+    Modified response reuses the stored metadata instead of downloading and
+    parsing the feed again.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize feed cache.
+
+        Args:
+            path: SQLite database file (default: ~/.cache/podcast-organizer/feeds.db)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR / "feeds.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS feeds "
+                "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, metadata TEXT NOT NULL)"
+            )
+
+    def get_many(self, urls: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str], Dict]]:
+        """
+        Look up cached entries for several feeds.
+
+        Args:
+            urls: Feed URLs
+
+        Returns:
+            Dict mapping each cached URL to its (etag, last_modified, metadata); misses are omitted
+        """
+        results = {}
+        with closing(sqlite3.connect(self.path)) as conn:
+            for i in range(0, len(urls), LOOKUP_CHUNK_SIZE):
+                chunk = urls[i:i + LOOKUP_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT url, etag, last_modified, metadata FROM feeds WHERE url IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                for url, etag, last_modified, metadata in rows:
+                    results[url] = (etag, last_modified, json.loads(metadata))
+        return results
+
+    def set_many(self, entries: Iterable[Tuple[str, Optional[str], Optional[str], Dict]]) -> None:
+        """
+        Store entries for several feeds.
+
+        Args:
+            entries: (url, etag, last_modified, metadata) tuples
+        """
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO feeds (url, etag, last_modified, metadata) VALUES (?, ?, ?, ?)",
+                (
+                    (url, etag, last_modified, json.dumps(metadata, ensure_ascii=False))
+                    for url, etag, last_modified, metadata in entries
+                )
+            )
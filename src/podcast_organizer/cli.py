@@ -2,15 +2,18 @@
 
 import click
 import time
+from dataclasses import replace
 from pathlib import Path
 
 from .opml_parser import parse_opml_limit
-from .rss_fetcher import fetch_all_rss_metadata_sync
-from .markdown_generator import generate_basic_markdown, generate_enriched_markdown, write_markdown
 from .config import load_config, validate_config
-from .ai_enricher import enrich_podcasts_with_ai
+from .cache import FeedCache
 from .logger import init_logger
 
+# rss_fetcher, ai_enricher and markdown_generator (httpx, feedparser and the
+# AI SDKs) are imported where they are used, so --help and early exits
+# don't pay their import time, and --no-ai runs never load the AI SDKs
+
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True, dir_okay=False))
@@ -38,6 +41,12 @@ from .logger import init_logger
     default=None,
     help='Maximum concurrent RSS fetches (overrides config)'
 )
+@click.option(
+    '--ai-concurrency',
+    type=int,
+    default=None,
+    help='Maximum concurrent AI requests (overrides config)'
+)
 @click.option(
     '--provider',
     type=click.Choice(['claude', 'openai'], case_sensitive=False),
@@ -49,6 +58,16 @@ from .logger import init_logger
     is_flag=True,
     help='Skip AI enrichment (Phase 1 output only)'
 )
+@click.option(
+    '--batch',
+    is_flag=True,
+    help='Use the provider Batch API (~50% cheaper, results can take up to 24 hours)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Ignore cached feeds and AI results; download every feed and send every podcast to the API'
+)
 @click.option(
     '--verbose', '-v',
     is_flag=True,
@@ -65,8 +84,11 @@ def main(
     limit: int,
     timeout: int,
     max_concurrent: int,
+    ai_concurrency: int,
     provider: str,
     no_ai: bool,
+    batch: bool,
+    no_cache: bool,
     verbose: bool,
     dry_run: bool
 ):
@@ -87,23 +109,27 @@ def main(
 
     # Apply CLI overrides
     if output:
-        config.output.default_file = output
+        config = replace(config, output=replace(config.output, default_file=output))
     if timeout is not None:
-        config.fetching.timeout = timeout
+        config = replace(config, fetching=replace(config.fetching, timeout=timeout))
     if max_concurrent is not None:
-        config.fetching.max_concurrent = max_concurrent
+        config = replace(config, fetching=replace(config.fetching, max_concurrent=max_concurrent))
+    if ai_concurrency is not None:
+        config = replace(config, ai=replace(config.ai, max_concurrent=ai_concurrency))
     if provider:
-        config.ai.provider = provider.lower()
-
-    # Validate config (only if using AI)
-    if not no_ai:
-        errors = validate_config(config, require_ai=True)
-        if errors:
-            logger.error("Configuration errors:")
-            for error in errors:
-                logger.print(f"  - {error}")
+        config = replace(config, ai=replace(config.ai, provider=provider.lower()))
+    if batch:
+        config = replace(config, ai=replace(config.ai, batch_mode="batch"))
+
+    # Validate config (the AI section only if using AI)
+    errors = validate_config(config, require_ai=not no_ai)
+    if errors:
+        logger.error("Configuration errors:")
+        for error in errors:
+            logger.print(f"  - {error}")
+        if not no_ai:
             logger.warning("\nTip: Copy .podcast-organizer.yaml.example to .podcast-organizer.yaml and add your API keys")
-            raise click.Abort()
+        raise click.Abort()
 
     # Determine phase
     phase = "Phase 1 (No AI)" if no_ai else f"Phase 2 (AI: {config.ai.provider})"
@@ -122,66 +148,85 @@ def main(
         logger.warning("No podcast entries found in OPML file")
         return
 
-    # Step 2: Fetch RSS metadata
-    logger.step(f"Step 2: Fetching RSS metadata", style="cyan")
+    # Step 2: Fetch RSS metadata (with AI enrichment, tagging starts as feeds arrive)
+    if no_ai:
+        logger.step(f"Step 2: Fetching RSS metadata", style="cyan")
+    else:
+        logger.step(f"Step 2: Fetching RSS metadata and AI enrichment", style="cyan")
     logger.print(f"  Settings: timeout={config.fetching.timeout}s, max_concurrent={config.fetching.max_concurrent}")
 
-    try:
-        podcasts = fetch_all_rss_metadata_sync(
-            entries,
-            max_concurrent=config.fetching.max_concurrent,
-            timeout=config.fetching.timeout,
-            verbose=verbose
-        )
-
-        successful = sum(1 for p in podcasts if p.has_metadata)
-        failed = len(podcasts) - successful
-
-        logger.success(f"Fetched: {successful} successful, {failed} failed\n")
+    from .rss_fetcher import fetch_all_rss_metadata_sync, fetch_rss_metadata_stream
 
-        if failed > 0 and verbose:
-            logger.warning("Failed feeds:")
-            for p in podcasts:
-                if not p.has_metadata:
-                    logger.print(f"  - {p.title}: {p.fetch_error}")
-            logger.print("")
+    # Unchanged feeds are revalidated with conditional requests instead of re-downloaded
+    feed_cache = None if no_cache else FeedCache()
 
-    except Exception as e:
-        logger.error(f"Error fetching RSS feeds: {e}")
-        raise click.Abort()
-
-    # Step 3: AI Enrichment (if enabled)
-    if not no_ai:
-        logger.step(f"Step 3: AI enrichment", style="cyan")
+    if no_ai:
+        try:
+            podcasts = fetch_all_rss_metadata_sync(
+                entries,
+                max_concurrent=config.fetching.max_concurrent,
+                timeout=config.fetching.timeout,
+                verbose=verbose,
+                feed_cache=feed_cache,
+                requests_per_second=config.fetching.requests_per_second,
+                per_host_concurrency=config.fetching.per_host_concurrency,
+                connection_pool_size=config.fetching.connection_pool_size
+            )
+        except Exception as e:
+            logger.error(f"Error fetching RSS feeds: {e}")
+            raise click.Abort()
+    else:
+        from .ai_enricher import enrich_podcast_stream_with_ai
 
         try:
-            podcasts = enrich_podcasts_with_ai(
-                podcasts,
+            podcasts = enrich_podcast_stream_with_ai(
+                fetch_rss_metadata_stream(
+                    entries,
+                    max_concurrent=config.fetching.max_concurrent,
+                    timeout=config.fetching.timeout,
+                    feed_cache=feed_cache,
+                    requests_per_second=config.fetching.requests_per_second,
+                    per_host_concurrency=config.fetching.per_host_concurrency,
+                    connection_pool_size=config.fetching.connection_pool_size,
+                    verbose=verbose
+                ),
                 config.ai,
                 output_file=config.output.default_file,
-                verbose=verbose
+                verbose=verbose,
+                use_cache=not no_cache,
+                expected_count=len(entries)
             )
-            logger.print("")
-
         except Exception as e:
-            logger.error(f"Error during AI enrichment: {e}")
+            logger.error(f"Error during RSS fetching or AI enrichment: {e}")
             raise click.Abort()
 
-    # Step 4 (or 3 if no AI): Generate markdown
-    step_num = 4 if not no_ai else 3
-    logger.step(f"Step {step_num}: Generating markdown output", style="cyan")
+    # One pass: the failed list gives both counts and the verbose listing
+    failed = [p for p in podcasts if not p.has_metadata]
 
-    try:
-        if no_ai:
-            markdown_content = generate_basic_markdown(podcasts)
-        else:
-            markdown_content = generate_enriched_markdown(podcasts)
+    logger.success(f"Fetched: {len(podcasts) - len(failed)} successful, {len(failed)} failed\n")
+
+    if failed and verbose:
+        logger.warning("Failed feeds:")
+        for p in failed:
+            logger.print(f"  - {p.title}: {p.fetch_error}")
+        logger.blank_line()
+
+    # Step 3: Generate markdown
+    logger.step(f"Step 3: Generating markdown output", style="cyan")
 
+    from .markdown_generator import DiscardWriter, open_markdown, stream_basic_markdown, stream_enriched_markdown
+
+    # Markdown is streamed to the file as it is generated
+    stream_markdown = stream_basic_markdown if no_ai else stream_enriched_markdown
+
+    try:
         if dry_run:
+            stream_markdown(podcasts, DiscardWriter())
             logger.warning("  Dry run - skipping file write")
             logger.print(f"  Would write to: {config.output.default_file}")
         else:
-            write_markdown(markdown_content, config.output.default_file)
+            with open_markdown(config.output.default_file) as f:
+                stream_markdown(podcasts, f)
             output_path = Path(config.output.default_file).resolve()
             logger.success(f"Written to: {output_path}\n")
 
@@ -1,35 +1,59 @@
 """Configuration management for podcast organizer."""
 
+import copy
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import yaml
 
+# libyaml-backed loader (bundled with the PyYAML wheels); pure Python otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@dataclass
+# API key setting and display name required by each AI provider
+PROVIDER_API_KEYS = {
+    'claude': ('anthropic_api_key', 'ANTHROPIC_API_KEY', 'Claude'),
+    'openai': ('openai_api_key', 'OPENAI_API_KEY', 'OpenAI'),
+}
+
+
+@dataclass(slots=True)
 class AIConfig:
     """AI provider configuration."""
     provider: str = "claude"  # claude or openai
     anthropic_api_key: Optional[str] = None
     openai_api_key: Optional[str] = None
     model: Optional[str] = None
+    max_concurrent: int = 5  # concurrent AI requests
+    batch_size: int = 30  # podcasts per categorization request (tag batches are sized by tokens)
+    batch_mode: str = "sync"  # sync or batch (provider Batch API, slower but ~50% cheaper)
+    single_pass: bool = False  # categorize and tag in one request per batch
+    use_itunes_categories: bool = False  # keep feed <itunes:category> instead of AI categorization
+    max_requests_per_minute: Optional[int] = None  # None = unlimited
+    max_tokens_per_minute: Optional[int] = None  # None = unlimited
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Output configuration."""
     default_file: str = "podcasts.md"
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchingConfig:
     """RSS fetching configuration."""
     timeout: int = 30
     max_concurrent: int = 10
+    requests_per_second: Optional[float] = None  # None = unlimited
+    per_host_concurrency: int = 6  # concurrent requests to a single feed host
+    connection_pool_size: int = 100  # open connections across all hosts
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration object."""
     ai: AIConfig = field(default_factory=AIConfig)
@@ -48,8 +72,14 @@ def find_config_file() -> Optional[Path]:
     Returns:
         Path to config file if found, None otherwise
     """
+    return _find_config_file(Path.cwd())
+
+
+@lru_cache(maxsize=None)
+def _find_config_file(cwd: Path) -> Optional[Path]:
+    """Search for the config file from cwd (memoized per working directory)."""
     # Check current directory
-    current_dir_config = Path(".podcast-organizer.yaml")
+    current_dir_config = cwd / ".podcast-organizer.yaml"
     if current_dir_config.exists():
         return current_dir_config
 
@@ -65,30 +95,56 @@ def load_config(config_path: Optional[Path] = None) -> Config:
     """
     Load configuration from file and environment variables.
 
+    Results are memoized per config file, file modification time and API key
+    environment variables, so repeated calls skip the YAML parse.
+
     Args:
         config_path: Optional explicit config file path
 
     Returns:
-        Config object with merged settings
+        Config object with merged settings (a fresh copy the caller may modify)
     """
-    config = Config()
-
     # Find config file if not explicitly provided
     if config_path is None:
         config_path = find_config_file()
 
+    mtime_ns = config_path.stat().st_mtime_ns if config_path and config_path.exists() else None
+    config = _load_config(
+        config_path, mtime_ns, os.getenv('ANTHROPIC_API_KEY'), os.getenv('OPENAI_API_KEY')
+    )
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=None)
+def _load_config(
+    config_path: Optional[Path],
+    mtime_ns: Optional[int],
+    anthropic_api_key: Optional[str],
+    openai_api_key: Optional[str]
+) -> Config:
+    """Build the Config for load_config (memoized; mtime_ns only keys the cache)."""
+    config = Config()
+
     # Load from YAML file if found
-    if config_path and config_path.exists():
+    if mtime_ns is not None:
         with open(config_path, 'r') as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=SafeLoader) or {}
 
         # AI configuration
         if 'ai' in data:
             ai_data = data['ai']
-            config.ai.provider = ai_data.get('provider', config.ai.provider)
+            # Normalized once here so downstream code can compare it directly
+            config.ai.provider = str(ai_data.get('provider', config.ai.provider)).lower()
             config.ai.anthropic_api_key = ai_data.get('anthropic_api_key')
             config.ai.openai_api_key = ai_data.get('openai_api_key')
             config.ai.model = ai_data.get('model')
+            config.ai.max_concurrent = ai_data.get('max_concurrent', config.ai.max_concurrent)
+            config.ai.batch_size = ai_data.get('batch_size', config.ai.batch_size)
+            config.ai.batch_mode = ai_data.get('batch_mode', config.ai.batch_mode)
+            config.ai.single_pass = ai_data.get('single_pass', config.ai.single_pass)
+            config.ai.use_itunes_categories = ai_data.get('use_itunes_categories', config.ai.use_itunes_categories)
+            config.ai.max_requests_per_minute = ai_data.get('max_requests_per_minute')
+            config.ai.max_tokens_per_minute = ai_data.get('max_tokens_per_minute')
 
         # Output configuration
         if 'output' in data:
@@ -100,12 +156,15 @@ def load_config(config_path: Optional[Path] = None) -> Config:
             fetching_data = data['fetching']
             config.fetching.timeout = fetching_data.get('timeout', config.fetching.timeout)
             config.fetching.max_concurrent = fetching_data.get('max_concurrent', config.fetching.max_concurrent)
+            config.fetching.requests_per_second = fetching_data.get('requests_per_second')
+            config.fetching.per_host_concurrency = fetching_data.get('per_host_concurrency', config.fetching.per_host_concurrency)
+            config.fetching.connection_pool_size = fetching_data.get('connection_pool_size', config.fetching.connection_pool_size)
 
     # Override with environment variables
-    if os.getenv('ANTHROPIC_API_KEY'):
-        config.ai.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
-    if os.getenv('OPENAI_API_KEY'):
-        config.ai.openai_api_key = os.getenv('OPENAI_API_KEY')
+    if anthropic_api_key:
+        config.ai.anthropic_api_key = anthropic_api_key
+    if openai_api_key:
+        config.ai.openai_api_key = openai_api_key
 
     return config
 
@@ -124,16 +183,29 @@ def validate_config(config: Config, require_ai: bool = True) -> list[str]:
     errors = []
 
     if require_ai:
-        provider = config.ai.provider.lower()
+        provider = config.ai.provider
 
-        if provider not in ['claude', 'openai']:
+        if provider not in PROVIDER_API_KEYS:
             errors.append(f"Invalid AI provider: {provider}. Must be 'claude' or 'openai'")
+        else:
+            key_attr, env_var, name = PROVIDER_API_KEYS[provider]
+            if not getattr(config.ai, key_attr):
+                errors.append(f"{name} provider selected but no {key_attr} found in config or {env_var} environment variable")
+
+        if config.ai.max_concurrent <= 0:
+            errors.append(f"Invalid ai.max_concurrent: {config.ai.max_concurrent}. Must be positive")
+
+        if config.ai.batch_mode not in ['sync', 'batch']:
+            errors.append(f"Invalid ai.batch_mode: {config.ai.batch_mode}. Must be 'sync' or 'batch'")
+
+        if config.ai.batch_size <= 0:
+            errors.append(f"Invalid ai.batch_size: {config.ai.batch_size}. Must be positive")
 
-        if provider == 'claude' and not config.ai.anthropic_api_key:
-            errors.append("Claude provider selected but no anthropic_api_key found in config or ANTHROPIC_API_KEY environment variable")
+        if config.ai.max_requests_per_minute is not None and config.ai.max_requests_per_minute <= 0:
+            errors.append(f"Invalid ai.max_requests_per_minute: {config.ai.max_requests_per_minute}. Must be positive")
 
-        if provider == 'openai' and not config.ai.openai_api_key:
-            errors.append("OpenAI provider selected but no openai_api_key found in config or OPENAI_API_KEY environment variable")
+        if config.ai.max_tokens_per_minute is not None and config.ai.max_tokens_per_minute <= 0:
+            errors.append(f"Invalid ai.max_tokens_per_minute: {config.ai.max_tokens_per_minute}. Must be positive")
 
     if config.fetching.timeout <= 0:
         errors.append(f"Invalid timeout: {config.fetching.timeout}. Must be positive")
@@ -141,4 +213,13 @@ def validate_config(config: Config, require_ai: bool = True) -> list[str]:
     if config.fetching.max_concurrent <= 0:
         errors.append(f"Invalid max_concurrent: {config.fetching.max_concurrent}. Must be positive")
 
+    if config.fetching.requests_per_second is not None and config.fetching.requests_per_second <= 0:
+        errors.append(f"Invalid fetching.requests_per_second: {config.fetching.requests_per_second}. Must be positive")
+
+    if config.fetching.per_host_concurrency <= 0:
+        errors.append(f"Invalid fetching.per_host_concurrency: {config.fetching.per_host_concurrency}. Must be positive")
+
+    if config.fetching.connection_pool_size <= 0:
+        errors.append(f"Invalid fetching.connection_pool_size: {config.fetching.connection_pool_size}. Must be positive")
+
     return errors
@@ -25,6 +25,20 @@ class PodcastLogger:
         self.console = Console()
         self.verbose = verbose
 
+    def _emit(self, message: str, style: Optional[str] = None):
+        """
+        Print a message in a style.
+
+        Messages are plain text: the style is passed directly instead of as
+        [style] markup, which skips Rich's markup parser and regex highlighter
+        on every call (and prints any brackets in the message literally).
+
+        Args:
+            message: Message to print
+            style: Optional Rich color/style
+        """
+        self.console.print(message, style=style or None, markup=False, highlight=False)
+
     def info(self, message: str, style: str = "cyan"):
         """
         Log informational message.
@@ -33,7 +47,7 @@ class PodcastLogger:
             message: Message to log
             style: Rich color/style (cyan, blue, white, etc.)
         """
-        self.console.print(f"[{style}]{message}[/{style}]")
+        self._emit(message, style)
 
     def success(self, message: str, prefix: str = "✓"):
         """
@@ -43,10 +57,7 @@ class PodcastLogger:
             message: Message to log
             prefix: Prefix symbol (default: checkmark)
         """
-        if prefix:
-            self.console.print(f"[green]{prefix} {message}[/green]")
-        else:
-            self.console.print(f"[green]{message}[/green]")
+        self._emit(f"{prefix} {message}" if prefix else message, "green")
 
     def warning(self, message: str):
         """
@@ -55,7 +66,7 @@ class PodcastLogger:
         Args:
             message: Warning message
         """
-        self.console.print(f"[yellow]{message}[/yellow]")
+        self._emit(message, "yellow")
 
     def error(self, message: str):
         """
@@ -64,7 +75,7 @@ class PodcastLogger:
         Args:
             message: Error message
         """
-        self.console.print(f"[red]{message}[/red]")
+        self._emit(message, "red")
 
     def verbose_info(self, message: str, style: str = "cyan"):
         """
@@ -85,7 +96,7 @@ class PodcastLogger:
             message: Header message
             style: Rich color/style
         """
-        self.console.print(f"[{style}]{message}[/{style}]")
+        self._emit(message, style)
 
     def step(self, message: str, style: str = ""):
         """
@@ -95,10 +106,7 @@ class PodcastLogger:
             message: Step message
             style: Optional Rich color/style
         """
-        if style:
-            self.console.print(f"[{style}]{message}[/{style}]")
-        else:
-            self.console.print(message)
+        self._emit(message, style)
 
     def print(self, message: str, style: Optional[str] = None):
         """
@@ -108,10 +116,19 @@ class PodcastLogger:
             message: Message to print
             style: Optional Rich color/style
         """
-        if style:
-            self.console.print(f"[{style}]{message}[/{style}]")
-        else:
-            self.console.print(message)
+        self._emit(message, style)
+
+    def blank_line(self, count: int = 1):
+        """
+        Print blank lines.
+
+        Uses Console.line, which writes the newlines without measuring or
+        styling an empty renderable like print("") does.
+
+        Args:
+            count: Number of blank lines
+        """
+        self.console.line(count)
 
 
 # Global logger instance (initialized in cli.py)
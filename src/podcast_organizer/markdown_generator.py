@@ -1,10 +1,26 @@
 """Markdown output generator for podcast metadata."""
 
-from typing import List, Dict, Tuple
-from collections import defaultdict
+import io
+import os
+import re
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Iterator, List, Optional, TextIO, Tuple
 from .rss_fetcher import PodcastMetadata
 
 
+# Fetch errors meaning the feed is gone: HTTP 404, DNS resolution failures,
+# connection refused / host unreachable
+DEAD_FEED_RE = re.compile(
+    r"404|nodename nor servname|name or service not known|failed to resolve|connection refused",
+    re.IGNORECASE
+)
+
+# One podcast's section; optional lines are filled in (or left empty) by _format_podcast
+PODCAST_TEMPLATE = "### {title}\n\n{link}**RSS Feed:** {xml_url}\n{description}{tags}{image}\n"
+
+
 def is_feed_no_longer_exists(error_msg: str) -> bool:
     """
     Determine if an error indicates the feed no longer exists.
@@ -15,28 +31,7 @@ def is_feed_no_longer_exists(error_msg: str) -> bool:
     Returns:
         True if feed no longer exists (404, DNS failure, etc.)
     """
-    if not error_msg:
-        return False
-
-    error_lower = error_msg.lower()
-
-    # HTTP 404
-    if "404" in error_msg:
-        return True
-
-    # DNS resolution failures
-    if "nodename nor servname" in error_lower:
-        return True
-    if "name or service not known" in error_lower:
-        return True
-    if "failed to resolve" in error_lower:
-        return True
-
-    # Connection refused / host unreachable
-    if "connection refused" in error_lower:
-        return True
-
-    return False
+    return bool(error_msg) and DEAD_FEED_RE.search(error_msg) is not None
 
 
 def categorize_failed_feeds(failed: List[PodcastMetadata]) -> Tuple[List[PodcastMetadata], List[PodcastMetadata]]:
@@ -61,6 +56,87 @@ def categorize_failed_feeds(failed: List[PodcastMetadata]) -> Tuple[List[Podcast
     return no_longer_exists, parsing_errors
 
 
+def _write_failed_section(
+    w: Callable[[str], int],
+    header: str,
+    intro: str,
+    podcasts: List[PodcastMetadata]
+) -> None:
+    """
+    Write one failed-feed section (nothing if it has no podcasts).
+
+    Podcasts are listed alphabetically (ignoring case, like the categories),
+    so the output does not depend on fetch order.
+
+    Args:
+        w: Write method of the output buffer
+        header: Section heading
+        intro: Sentence introducing the list
+        podcasts: Failed PodcastMetadata objects in this section
+    """
+    if not podcasts:
+        return
+
+    w(f"## {header}\n\n{intro}\n\n")
+
+    for podcast in sorted(podcasts, key=lambda p: p.title.casefold()):
+        error_msg = podcast.fetch_error or "Unknown error"
+        w(f"- **{podcast.title}**\n  - URL: {podcast.xml_url}\n  - Error: {error_msg}\n\n")
+
+
+def _write_failed_feeds(w: Callable[[str], int], failed: List[PodcastMetadata]) -> None:
+    """
+    Write the failed-feed sections, grouped by kind of failure.
+
+    Args:
+        w: Write method of the output buffer
+        failed: List of failed PodcastMetadata objects
+    """
+    no_longer_exists, parsing_errors = categorize_failed_feeds(failed)
+
+    # Feeds that no longer exist (404, DNS failures)
+    _write_failed_section(
+        w, "Feeds No Longer Exist",
+        "These feeds returned 404 errors or have DNS resolution failures:",
+        no_longer_exists
+    )
+
+    # Feed parsing errors
+    _write_failed_section(
+        w, "Feed Parsing Errors",
+        "These feeds exist but have XML/parsing errors:",
+        parsing_errors
+    )
+
+
+def _format_podcast(
+    podcast: PodcastMetadata,
+    title: str,
+    description: Optional[str],
+    tags: Optional[List[str]] = None
+) -> str:
+    """
+    Format one podcast's markdown section in a single template call.
+
+    Args:
+        podcast: PodcastMetadata to format
+        title: Title to show
+        description: Description to show (may be None)
+        tags: Tags to show (omitted if empty)
+
+    Returns:
+        Markdown section, ending with a blank line
+    """
+    return PODCAST_TEMPLATE.format(
+        title=title,
+        link=f"**Link:** {podcast.link}\n" if podcast.link else "",
+        xml_url=podcast.xml_url,
+        description=f"**Description:** {description}\n" if description else "",
+        tags=f"**Tags:** #{' #'.join(tags)}\n" if tags else "",
+        image=f"<img src=\"{podcast.image_url}\" width=\"200\">\n" if podcast.image_url else ""
+    )
+
+
 def generate_basic_markdown(podcasts: List[PodcastMetadata]) -> str:
     """
     Generate a basic markdown file from podcast metadata (Phase 1 - no AI).
@@ -71,66 +147,44 @@ def generate_basic_markdown(podcasts: List[PodcastMetadata]) -> str:
     Returns:
         Formatted markdown string
     """
-    lines = []
+    buf = io.StringIO()
+    stream_basic_markdown(podcasts, buf)
+    return buf.getvalue()
 
-    # Header
-    lines.append("# My Podcasts\n")
-    lines.append(f"Total podcasts: {len(podcasts)}\n")
-    lines.append(f"Successfully fetched: {sum(1 for p in podcasts if p.has_metadata)}\n")
-    lines.append(f"Failed: {sum(1 for p in podcasts if not p.has_metadata)}\n")
-    lines.append("")
+
+def stream_basic_markdown(podcasts: List[PodcastMetadata], fp: TextIO) -> None:
+    """
+    Write basic markdown (Phase 1 - no AI) to a text file as it is generated.
+
+    Args:
+        podcasts: List of PodcastMetadata objects
+        fp: Writable text file
+    """
+    w = fp.write
 
     # Group podcasts: successful first, then failed
-    successful = [p for p in podcasts if p.has_metadata]
-    failed = [p for p in podcasts if not p.has_metadata]
+    successful = []
+    failed = []
+    for podcast in podcasts:
+        (successful if podcast.has_metadata else failed).append(podcast)
+
+    # Header
+    w("# My Podcasts\n\n")
+    w(f"Total podcasts: {len(podcasts)}\n\n")
+    w(f"Successfully fetched: {len(successful)}\n\n")
+    w(f"Failed: {len(failed)}\n\n")
+    w("\n")
 
     # Successful podcasts
     if successful:
-        lines.append("## Podcasts\n")
+        w("## Podcasts\n\n")
 
         for podcast in successful:
-            lines.append(f"### {podcast.display_title}\n")
-
-            if podcast.link:
-                lines.append(f"**Link:** {podcast.link}")
-
-            lines.append(f"**RSS Feed:** {podcast.xml_url}")
-
-            if podcast.description:
-                lines.append(f"**Description:** {podcast.description}")
-
-            if podcast.image_url:
-                lines.append(f"<img src=\"{podcast.image_url}\" width=\"200\">")
-
-            lines.append("")  # Blank line between podcasts
+            w(_format_podcast(podcast, podcast.display_title, podcast.description))
 
     # Failed podcasts - categorized
     if failed:
-        no_longer_exists, parsing_errors = categorize_failed_feeds(failed)
-
-        # Feeds that no longer exist (404, DNS failures)
-        if no_longer_exists:
-            lines.append("## Feeds No Longer Exist\n")
-            lines.append("These feeds returned 404 errors or have DNS resolution failures:\n")
-
-            for podcast in no_longer_exists:
-                error_msg = podcast.fetch_error or "Unknown error"
-                lines.append(f"- **{podcast.title}**")
-                lines.append(f"  - URL: {podcast.xml_url}")
-                lines.append(f"  - Error: {error_msg}\n")
-
-        # Feed parsing errors
-        if parsing_errors:
-            lines.append("## Feed Parsing Errors\n")
-            lines.append("These feeds exist but have XML/parsing errors:\n")
-
-            for podcast in parsing_errors:
-                error_msg = podcast.fetch_error or "Unknown error"
-                lines.append(f"- **{podcast.title}**")
-                lines.append(f"  - URL: {podcast.xml_url}")
-                lines.append(f"  - Error: {error_msg}\n")
-
-    return "\n".join(lines)
+        _write_failed_feeds(w, failed)
 
 
 def generate_enriched_markdown(podcasts: List[PodcastMetadata]) -> str:
@@ -143,115 +197,106 @@ def generate_enriched_markdown(podcasts: List[PodcastMetadata]) -> str:
     Returns:
         Formatted markdown string
     """
-    lines = []
-
-    # Header
-    lines.append("# My Podcasts\n")
-    lines.append(f"Total podcasts: {len(podcasts)}\n")
-    lines.append(f"Successfully fetched: {sum(1 for p in podcasts if p.has_metadata)}\n")
-    lines.append(f"Failed: {sum(1 for p in podcasts if not p.has_metadata)}\n")
-    lines.append("")
-
-    # Group podcasts by category
-    successful = [p for p in podcasts if p.has_metadata]
-    failed = [p for p in podcasts if not p.has_metadata]
-
-    # Organize successful podcasts by category
-    categorized: Dict[str, List[PodcastMetadata]] = defaultdict(list)
-    uncategorized = []
-
-    for podcast in successful:
-        if podcast.category:
-            categorized[podcast.category].append(podcast)
-        else:
-            uncategorized.append(podcast)
-
-    # Sort categories alphabetically
-    sorted_categories = sorted(categorized.keys())
-
-    # Output each category
-    for category in sorted_categories:
-        lines.append(f"## {category}\n")
+    buf = io.StringIO()
+    stream_enriched_markdown(podcasts, buf)
+    return buf.getvalue()
 
-        for podcast in categorized[category]:
-            lines.append(f"### {podcast.display_title}\n")
 
-            if podcast.link:
-                lines.append(f"**Link:** {podcast.link}")
-
-            lines.append(f"**RSS Feed:** {podcast.xml_url}")
-
-            # Use enhanced description if available
-            description = podcast.final_description
-            if description:
-                lines.append(f"**Description:** {description}")
+def stream_enriched_markdown(podcasts: List[PodcastMetadata], fp: TextIO) -> None:
+    """
+    Write AI-enriched markdown (Phase 2) to a text file as it is generated.
 
-            # Add tags
-            if podcast.tags:
-                tags_str = " ".join(f"#{tag}" for tag in podcast.tags)
-                lines.append(f"**Tags:** {tags_str}")
+    Args:
+        podcasts: List of PodcastMetadata objects with AI enrichment
+        fp: Writable text file
+    """
+    w = fp.write
 
-            if podcast.image_url:
-                lines.append(f"<img src=\"{podcast.image_url}\" width=\"200\">")
+    # Group podcasts: successful first, then failed
+    successful = []
+    failed = []
+    for podcast in podcasts:
+        (successful if podcast.has_metadata else failed).append(podcast)
+
+    # Sort once so each category is a contiguous run: categories alphabetically
+    # (ignoring case so AI label casing doesn't reorder them), uncategorized last,
+    # podcasts alphabetically within each category. Category and title are read
+    # once per podcast and carried alongside it.
+    rows = sorted(
+        ((podcast.category or None, podcast.display_title, podcast) for podcast in successful),
+        key=lambda row: (not row[0], (row[0] or "").casefold(), row[0] or "", row[1].casefold())
+    )
 
-            lines.append("")  # Blank line between podcasts
+    # Header
+    w("# My Podcasts\n\n")
+    w(f"Total podcasts: {len(podcasts)}\n\n")
+    w(f"Successfully fetched: {len(successful)}\n\n")
+    w(f"Failed: {len(failed)}\n\n")
+    w("\n")
 
-    # Uncategorized podcasts (shouldn't happen with AI, but just in case)
-    if uncategorized:
-        lines.append("## Uncategorized\n")
+    # Output each category
+    for category, group in groupby(rows, key=itemgetter(0)):
+        if category:
+            w(f"## {category}\n\n")
 
-        for podcast in uncategorized:
-            lines.append(f"### {podcast.display_title}\n")
+            for _, title, podcast in group:
+                # Use enhanced description if available
+                w(_format_podcast(podcast, title, podcast.final_description, podcast.tags))
+        else:
+            # Uncategorized podcasts (shouldn't happen with AI, but just in case)
+            w("## Uncategorized\n\n")
 
-            if podcast.link:
-                lines.append(f"**Link:** {podcast.link}")
+            for _, title, podcast in group:
+                w(_format_podcast(podcast, title, podcast.description))
 
-            lines.append(f"**RSS Feed:** {podcast.xml_url}")
+    # Failed podcasts - categorized
+    if failed:
+        _write_failed_feeds(w, failed)
 
-            if podcast.description:
-                lines.append(f"**Description:** {podcast.description}")
 
-            if podcast.image_url:
-                lines.append(f"<img src=\"{podcast.image_url}\" width=\"200\">")
+class DiscardWriter(io.TextIOBase):
+    """Text sink that drops everything written (dry runs render without encoding or storing output)."""
 
-            lines.append("")
+    def writable(self) -> bool:
+        return True
 
-    # Failed podcasts - categorized
-    if failed:
-        no_longer_exists, parsing_errors = categorize_failed_feeds(failed)
+    def write(self, s: str) -> int:
+        return len(s)
 
-        # Feeds that no longer exist (404, DNS failures)
-        if no_longer_exists:
-            lines.append("## Feeds No Longer Exist\n")
-            lines.append("These feeds returned 404 errors or have DNS resolution failures:\n")
 
-            for podcast in no_longer_exists:
-                error_msg = podcast.fetch_error or "Unknown error"
-                lines.append(f"- **{podcast.title}**")
-                lines.append(f"  - URL: {podcast.xml_url}")
-                lines.append(f"  - Error: {error_msg}\n")
+@contextmanager
+def open_markdown(output_path: str) -> Iterator[TextIO]:
+    """
+    Open a markdown output file for writing, replacing it atomically.
 
-        # Feed parsing errors
-        if parsing_errors:
-            lines.append("## Feed Parsing Errors\n")
-            lines.append("These feeds exist but have XML/parsing errors:\n")
+    Content goes to a temporary file next to the output, which replaces it
+    only once the block completes, so a crash mid-write never leaves a
+    truncated file behind.
 
-            for podcast in parsing_errors:
-                error_msg = podcast.fetch_error or "Unknown error"
-                lines.append(f"- **{podcast.title}**")
-                lines.append(f"  - URL: {podcast.xml_url}")
-                lines.append(f"  - Error: {error_msg}\n")
+    Args:
+        output_path: Path to output file
 
-    return "\n".join(lines)
+    Yields:
+        Writable UTF-8 text file
+    """
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 def write_markdown(content: str, output_path: str) -> None:
     """
-    Write markdown content to a file.
+    Write markdown content to a file atomically.
 
     Args:
         content: Markdown content string
         output_path: Path to output file
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with open_markdown(output_path) as f:
         f.write(content)
@@ -2,11 +2,11 @@
 
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from urllib.parse import unquote
 
 
-@dataclass
+@dataclass(slots=True)
 class PodcastEntry:
     """Represents a podcast entry from OPML."""
     text: str
@@ -14,17 +14,20 @@ class PodcastEntry:
     xml_url: str
 
     def __post_init__(self):
-        """Decode URL-encoded strings."""
-        self.text = unquote(self.text)
-        self.title = unquote(self.title)
+        """Decode URL-encoded strings (most names have no % escapes, so skip the call)."""
+        if '%' in self.text:
+            self.text = unquote(self.text)
+        if '%' in self.title:
+            self.title = unquote(self.title)
 
 
-def parse_opml(file_path: str) -> List[PodcastEntry]:
+def parse_opml(file_path: str, limit: Optional[int] = None) -> List[PodcastEntry]:
     """
     Parse an OPML file and extract podcast RSS feed information.
 
     Args:
         file_path: Path to the OPML file
+        limit: Stop after this many entries, without parsing the rest of the file (None for all)
 
     Returns:
         List of PodcastEntry objects containing podcast metadata
@@ -33,13 +36,22 @@ def parse_opml(file_path: str) -> List[PodcastEntry]:
         FileNotFoundError: If the OPML file doesn't exist
         ET.ParseError: If the OPML file is malformed
     """
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-
     podcasts = []
 
-    # Find all outline elements with type="rss"
-    for outline in root.findall(".//outline[@type='rss']"):
+    # Stream the file instead of building the whole tree: attributes are
+    # complete at an element's start event, and elements are cleared at their
+    # end event once processed
+    for event, outline in ET.iterparse(file_path, events=("start", "end")):
+        if outline.tag != 'outline':
+            continue
+        if event == "end":
+            outline.clear()
+            continue
+
+        # Only outline elements with type="rss"
+        if outline.get('type') != 'rss':
+            continue
+
         text = outline.get('text', '')
         title = outline.get('title', '')
         xml_url = outline.get('xmlUrl', '')
@@ -60,6 +72,9 @@ def parse_opml(file_path: str) -> List[PodcastEntry]:
             xml_url=xml_url
         ))
 
+        if limit is not None and len(podcasts) >= limit:
+            break
+
     return podcasts
 
 
@@ -74,9 +89,4 @@ def parse_opml_limit(file_path: str, limit: int = None) -> List[PodcastEntry]:
     Returns:
         List of PodcastEntry objects
     """
-    podcasts = parse_opml(file_path)
-
-    if limit is not None and limit > 0:
-        return podcasts[:limit]
-
-    return podcasts
+    return parse_opml(file_path, limit if limit is not None and limit > 0 else None)
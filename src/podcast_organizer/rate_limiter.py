@@ -0,0 +1,111 @@
+"""Token-bucket rate limiting for AI provider requests."""
+
+import asyncio
+import time
+from typing import Optional
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of tokens in a prompt.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count (~4 characters per token)
+    """
+    return len(text) // 4
+
+
+def estimate_request_tokens(system_prompt: str, prompt: str, max_tokens: int) -> int:
+    """
+    Estimate the tokens a request counts against a tokens-per-minute limit.
+
+    The system prompt is sent with every request, and providers count the
+    max_tokens output reservation against the limit as well.
+
+    Args:
+        system_prompt: System prompt text
+        prompt: User prompt text
+        max_tokens: Response token limit
+
+    Returns:
+        Estimated input tokens plus the output reservation
+    """
+    return estimate_tokens(system_prompt) + estimate_tokens(prompt) + max_tokens
+
+
+class RateLimiter:
+    """
+    Shared limiter with separate requests-per-minute and tokens-per-minute buckets.
+
+    Each bucket starts full and refills continuously (limit / 60 per second).
+    A limit of None disables that bucket.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute (None for unlimited)
+            tokens_per_minute: Maximum request tokens per minute, input plus
+                reserved output (None for unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute or 0)
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add capacity accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        if self.requests_per_minute:
+            self._available_requests = min(
+                float(self.requests_per_minute),
+                self._available_requests + elapsed * self.requests_per_minute / 60
+            )
+        if self.tokens_per_minute:
+            self._available_tokens = min(
+                float(self.tokens_per_minute),
+                self._available_tokens + elapsed * self.tokens_per_minute / 60
+            )
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until both buckets have capacity for one request of `tokens` tokens.
+
+        Args:
+            tokens: Estimated tokens for the request (see estimate_request_tokens)
+        """
+        # A single request larger than the whole bucket would never fit
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        while True:
+            self._refill()
+
+            wait = 0.0
+            if self.requests_per_minute and self._available_requests < 1:
+                wait = max(wait, (1 - self._available_requests) * 60 / self.requests_per_minute)
+            if self.tokens_per_minute and self._available_tokens < tokens:
+                wait = max(wait, (tokens - self._available_tokens) * 60 / self.tokens_per_minute)
+
+            # Check-and-consume has no await in between, so it is atomic on the event loop
+            if wait <= 0:
+                if self.requests_per_minute:
+                    self._available_requests -= 1
+                if self.tokens_per_minute:
+                    self._available_tokens -= tokens
+                return
+
+            await asyncio.sleep(wait)
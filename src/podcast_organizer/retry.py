@@ -0,0 +1,85 @@
+"""Retry with exponential backoff and jitter for transient API errors."""
+
+import asyncio
+import random
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from .logger import get_logger
+
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying (timeouts, conflicts, rate limits, overload, server errors)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Check whether an API error is transient.
+
+    Args:
+        error: Exception raised by an API client
+
+    Returns:
+        True for connection errors and retryable HTTP statuses
+    """
+    status_code = getattr(error, "status_code", None)
+    return status_code is None or status_code in RETRYABLE_STATUS_CODES
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Read the Retry-After header from an API error, if present.
+
+    Args:
+        error: Exception raised by an API client
+
+    Returns:
+        Seconds to wait, or None if the header is missing or not numeric
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def retry_async(
+    func: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...],
+    max_attempts: int = 6,
+    initial_wait: float = 1.0,
+    max_wait: float = 30.0
+) -> T:
+    """
+    Await func(), retrying transient failures with exponential backoff and jitter.
+
+    Args:
+        func: Zero-argument coroutine function to call
+        retry_on: Exception types that may be retried
+        max_attempts: Maximum number of attempts (including the first)
+        initial_wait: Base wait in seconds, doubled after each failure
+        max_wait: Maximum backoff in seconds (before jitter)
+
+    Returns:
+        Result of func()
+
+    Raises:
+        The last exception if attempts are exhausted or the error is not retryable
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await func()
+        except retry_on as e:
+            if attempt == max_attempts or not is_retryable(e):
+                raise
+
+            wait = retry_after_seconds(e)
+            if wait is None:
+                wait = min(max_wait, initial_wait * 2 ** (attempt - 1)) + random.uniform(0, initial_wait)
+
+            get_logger().warning(f"Transient API error ({e}), retrying in {wait:.1f}s (attempt {attempt}/{max_attempts})")
+            await asyncio.sleep(wait)
@@ -1,20 +1,43 @@
 """RSS feed fetcher for extracting podcast metadata."""
 
 import asyncio
+import re
+import time
+from collections import defaultdict
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 import feedparser
 import httpx
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .cache import FeedCache
 from .opml_parser import PodcastEntry
 
 
 console = Console()
 
+# feedparser's scheme for <itunes:category> tags
+ITUNES_SCHEME = 'http://www.itunes.com/'
 
-@dataclass
+# User-Agent header is required by some feed hosts (e.g., Buzzsprout)
+HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; Podcast Organizer/1.0; +https://github.com)'}
+
+# Start of the first RSS <item> (episode); the episode list runs to the last </item>
+RSS_ITEM_RE = re.compile(rb'<item[\s>]')
+RSS_ITEM_END = b'</item>'
+
+# Bytes of a feed read on the first request; channel metadata sits at the top,
+# so long episode histories are not downloaded unless the head is not enough
+FEED_HEAD_BYTES = 256 * 1024
+
+# PodcastMetadata fields parsed from a feed (stored by FeedCache)
+FEED_FIELDS = ('rss_title', 'link', 'description', 'image_url', 'itunes_category')
+
+
+@dataclass(slots=True)
 class PodcastMetadata:
     """Represents enriched podcast metadata from RSS feed."""
     # Original OPML data
@@ -26,6 +49,7 @@ class PodcastMetadata:
     link: Optional[str] = None
     description: Optional[str] = None
     image_url: Optional[str] = None
+    itunes_category: Optional[str] = None
 
     # AI enrichment data (Phase 2)
     category: Optional[str] = None
@@ -65,47 +89,130 @@ async def fetch_rss_metadata(
     Returns:
         PodcastMetadata with fetched information
     """
+    async with create_feed_client(timeout) as client:
+        metadata, _ = await _fetch_rss_metadata(entry, client, timeout)
+    return metadata
+
+
+def create_feed_client(timeout: int = 30, connection_pool_size: int = 100) -> httpx.AsyncClient:
+    """
+    Create the HTTP/2 client shared by RSS fetches.
+
+    Many feeds live on a few hosts (Buzzsprout, Libsyn, Megaphone), so
+    keep-alive connections, TLS sessions and HTTP/2 multiplexing are reused
+    across them.
+
+    Args:
+        timeout: Request timeout in seconds
+        connection_pool_size: Maximum open connections across all hosts
+
+    Returns:
+        Configured httpx.AsyncClient (caller must close it)
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        headers=HEADERS,
+        limits=httpx.Limits(max_connections=connection_pool_size),
+        http2=True
+    )
+
+
+async def _fetch_rss_metadata(
+    entry: PodcastEntry,
+    client: httpx.AsyncClient,
+    timeout: int = 30,
+    cached: Optional[Tuple[Optional[str], Optional[str], Dict]] = None
+) -> Tuple[PodcastMetadata, Optional[Tuple[Optional[str], Optional[str], Dict]]]:
+    """
+    Fetch RSS metadata for a single podcast, revalidating a cached copy.
+
+    Args:
+        entry: PodcastEntry with RSS URL
+        client: Client from create_feed_client()
+        timeout: Request timeout in seconds (used in error messages)
+        cached: (etag, last_modified, metadata) from FeedCache, if any
+
+    Returns:
+        Tuple of (PodcastMetadata, new (etag, last_modified, metadata) cache
+        entry or None if there is nothing new to store)
+    """
     metadata = PodcastMetadata(
         title=entry.title,
         xml_url=entry.xml_url
     )
 
-    # User-Agent header is required by some feed hosts (e.g., Buzzsprout)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; Podcast Organizer/1.0; +https://github.com)'
-    }
+    headers = {}
+
+    # Conditional GET: an unchanged feed answers 304 Not Modified with no body
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
 
     try:
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, headers=headers) as client:
-            response = await client.get(entry.xml_url)
-            response.raise_for_status()
+        response, content, complete = await _get_feed_head(client, entry.xml_url, headers)
 
-            # Parse RSS feed
-            feed = feedparser.parse(response.text)
+        if cached and response.status_code == 304:
+            for name in FEED_FIELDS:
+                setattr(metadata, name, cached[2].get(name))
+            return metadata, None
 
-            if feed.bozo:
-                # Feed has parsing errors
-                metadata.fetch_error = f"Feed parsing error: {feed.get('bozo_exception', 'Unknown error')}"
-                return metadata
+        # Range Not Satisfiable (e.g. an empty file) falls through to a plain GET
+        if response.status_code != 416:
+            response.raise_for_status()
 
-            # Extract channel metadata
-            channel = feed.get('feed', {})
+        # Parse RSS feed in a worker thread so other downloads keep going meanwhile.
+        # The raw bytes are passed (feedparser reads the declared XML encoding),
+        # skipping a decode to str that feedparser would re-encode.
+        content_type = response.headers.get('Content-Type')
+        if complete:
+            feed = await asyncio.to_thread(_parse_feed, content, content_type)
+        else:
+            feed = await asyncio.to_thread(_parse_feed_head, content, content_type) if content else None
+
+            # The head was not enough: download the whole feed
+            if feed is None:
+                response = await client.get(entry.xml_url)
+                response.raise_for_status()
+                feed = await asyncio.to_thread(_parse_feed, response.content, response.headers.get('Content-Type'))
+
+        if _feed_parse_failed(feed):
+            # Feed has parsing errors
+            metadata.fetch_error = f"Feed parsing error: {feed.get('bozo_exception', 'Unknown error')}"
+            return metadata, None
+
+        # Extract channel metadata
+        channel = feed.get('feed', {})
+
+        metadata.rss_title = channel.get('title', '').strip()
+        metadata.link = channel.get('link', '').strip()
+
+        # Try multiple description fields
+        metadata.description = (
+            channel.get('summary', '').strip() or
+            channel.get('subtitle', '').strip() or
+            channel.get('description', '').strip()
+        )
 
-            metadata.rss_title = channel.get('title', '').strip()
-            metadata.link = channel.get('link', '').strip()
+        # Try to get image URL
+        if 'image' in channel and 'href' in channel['image']:
+            metadata.image_url = channel['image']['href']
+        elif 'image' in channel and 'url' in channel['image']:
+            metadata.image_url = channel['image']['url']
 
-            # Try multiple description fields
-            metadata.description = (
-                channel.get('summary', '').strip() or
-                channel.get('subtitle', '').strip() or
-                channel.get('description', '').strip()
-            )
+        # Primary <itunes:category> (the first one; nested subcategories follow it)
+        metadata.itunes_category = next(
+            (tag['term'] for tag in channel.get('tags', []) if tag.get('scheme') == ITUNES_SCHEME and tag.get('term')),
+            None
+        )
 
-            # Try to get image URL
-            if 'image' in channel and 'href' in channel['image']:
-                metadata.image_url = channel['image']['href']
-            elif 'image' in channel and 'url' in channel['image']:
-                metadata.image_url = channel['image']['url']
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            return metadata, (etag, last_modified, {name: getattr(metadata, name) for name in FEED_FIELDS})
 
     except httpx.TimeoutException:
         metadata.fetch_error = f"Timeout after {timeout}s"
@@ -114,14 +221,132 @@ async def fetch_rss_metadata(
     except Exception as e:
         metadata.fetch_error = f"Error: {str(e)}"
 
-    return metadata
+    return metadata, None
+
+
+def _feed_parse_failed(feed: feedparser.FeedParserDict) -> bool:
+    """
+    Check whether feedparser hit a real parsing error.
+
+    Args:
+        feed: Result of feedparser.parse()
+
+    Returns:
+        True if the feed is malformed (a charset mismatch between HTTP header
+        and XML declaration still parses fine, so it does not count)
+    """
+    return bool(feed.bozo) and not isinstance(feed.get('bozo_exception'), feedparser.CharacterEncodingOverride)
+
+
+def _parse_feed(content: bytes, content_type: Optional[str] = None) -> feedparser.FeedParserDict:
+    """
+    Parse a feed, skipping its episodes when possible.
+
+    Only channel metadata is used, so for RSS feeds the span from the first
+    <item> to the last </item> is cut out and feedparser never parses (or
+    date-normalizes) the episode list; channel elements on either side of the
+    episodes are kept. The whole feed is parsed instead if the cut-down feed
+    fails to parse or has no title (e.g. an "<item" inside a CDATA section).
+
+    Args:
+        content: Raw response body
+        content_type: Content-Type response header (for its charset)
+
+    Returns:
+        feedparser result
+    """
+    response_headers = {'content-type': content_type} if content_type else None
+
+    first_item = RSS_ITEM_RE.search(content)
+    last_item_end = content.rfind(RSS_ITEM_END)
+    if first_item and last_item_end > first_item.start():
+        feed = feedparser.parse(
+            content[:first_item.start()] + content[last_item_end + len(RSS_ITEM_END):],
+            response_headers=response_headers
+        )
+        if not _feed_parse_failed(feed) and feed.get('feed', {}).get('title'):
+            return feed
+
+    return feedparser.parse(content, response_headers=response_headers)
+
+
+def _parse_feed_head(content: bytes, content_type: Optional[str] = None) -> Optional[feedparser.FeedParserDict]:
+    """
+    Parse the channel metadata from the first bytes of an RSS feed.
+
+    Everything from the first <item> on is cut off and the channel is closed
+    by hand.
+
+    Args:
+        content: Start of the response body (may end mid-element)
+        content_type: Content-Type response header (for its charset)
+
+    Returns:
+        feedparser result, or None if the head has no complete channel
+        metadata (no <item> yet, not RSS 2.0, or no title)
+    """
+    first_item = RSS_ITEM_RE.search(content)
+    if not first_item:
+        return None
+
+    feed = feedparser.parse(
+        content[:first_item.start()] + b'</channel></rss>',
+        response_headers={'content-type': content_type} if content_type else None
+    )
+    if _feed_parse_failed(feed) or not feed.get('feed', {}).get('title'):
+        return None
+    return feed
+
+
+async def _get_feed_head(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str]
+) -> Tuple[httpx.Response, bytes, bool]:
+    """
+    Download up to FEED_HEAD_BYTES of a feed.
+
+    A Range header asks the server for just the head; servers that ignore it
+    are read only up to the limit and the connection is dropped.
+
+    Args:
+        client: Client from create_feed_client()
+        url: Feed URL
+        headers: Extra request headers (conditional GET validators)
+
+    Returns:
+        Tuple of (response, body read so far, whether that body is the whole feed)
+    """
+    async with client.stream('GET', url, headers={**headers, 'Range': f'bytes=0-{FEED_HEAD_BYTES - 1}'}) as response:
+        if response.status_code not in (200, 206):
+            return response, b'', False
+
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= FEED_HEAD_BYTES:
+                return response, b''.join(chunks), False
+
+        # A 206 is the whole feed only if the range covered all of it
+        complete = response.status_code == 200
+        if not complete:
+            content_range = re.fullmatch(r'bytes 0-(\d+)/(\d+)', response.headers.get('Content-Range', ''))
+            complete = bool(content_range) and int(content_range[1]) + 1 >= int(content_range[2])
+
+        return response, b''.join(chunks), complete
 
 
 async def fetch_all_rss_metadata(
     entries: List[PodcastEntry],
     max_concurrent: int = 10,
     timeout: int = 30,
-    verbose: bool = False
+    verbose: bool = False,
+    feed_cache: Optional[FeedCache] = None,
+    requests_per_second: Optional[float] = None,
+    per_host_concurrency: int = 6,
+    connection_pool_size: int = 100
 ) -> List[PodcastMetadata]:
     """
     Fetch RSS metadata for multiple podcasts concurrently.
@@ -131,45 +356,119 @@ async def fetch_all_rss_metadata(
         max_concurrent: Maximum concurrent requests
         timeout: Request timeout in seconds
         verbose: Show progress information
+        feed_cache: Optional cache for conditional requests
+        requests_per_second: Maximum new requests per second (None for unlimited)
+        per_host_concurrency: Maximum concurrent requests to a single host
+        connection_pool_size: Maximum open connections across all hosts
 
     Returns:
         List of PodcastMetadata objects
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
+    results: List[Optional[PodcastMetadata]] = [None] * len(entries)
 
-    async def fetch_with_semaphore(entry: PodcastEntry) -> PodcastMetadata:
-        async with semaphore:
-            return await fetch_rss_metadata(entry, timeout)
-
-    if verbose:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task(
-                f"Fetching RSS feeds for {len(entries)} podcasts...",
-                total=None
-            )
+    async for index, metadata in fetch_rss_metadata_stream(
+        entries, max_concurrent, timeout, feed_cache,
+        requests_per_second, per_host_concurrency, connection_pool_size, verbose
+    ):
+        results[index] = metadata
+
+    return results
+
+
+async def fetch_rss_metadata_stream(
+    entries: List[PodcastEntry],
+    max_concurrent: int = 10,
+    timeout: int = 30,
+    feed_cache: Optional[FeedCache] = None,
+    requests_per_second: Optional[float] = None,
+    per_host_concurrency: int = 6,
+    connection_pool_size: int = 100,
+    verbose: bool = False
+) -> AsyncIterator[Tuple[int, PodcastMetadata]]:
+    """
+    Fetch RSS metadata for multiple podcasts, yielding each as it completes.
+
+    Lets consumers start work on early feeds while slow feeds still download.
+    With a feed cache, feeds are requested conditionally and the validators
+    of changed feeds are stored once the stream is exhausted. All requests
+    share one connection pool; per-host limits keep feeds on the same CDN
+    (e.g. megaphone.fm, libsyn) from monopolizing it.
+
+    Args:
+        entries: List of PodcastEntry objects
+        max_concurrent: Maximum concurrent requests
+        timeout: Request timeout in seconds
+        feed_cache: Optional cache for conditional requests
+        requests_per_second: Maximum new requests per second (None for unlimited)
+        per_host_concurrency: Maximum concurrent requests to a single host
+        connection_pool_size: Maximum open connections across all hosts
+        verbose: Show progress information
 
-            results = await asyncio.gather(
-                *[fetch_with_semaphore(entry) for entry in entries]
+    Yields:
+        (index, PodcastMetadata) pairs in completion order; index is the
+        entry's position in entries
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    host_semaphores = defaultdict(lambda: asyncio.Semaphore(per_host_concurrency))
+    cached_feeds = feed_cache.get_many([entry.xml_url for entry in entries]) if feed_cache else {}
+    cache_updates = []
+
+    # Request start times are spaced 1 / requests_per_second apart
+    interval = 1 / requests_per_second if requests_per_second else 0.0
+    next_start = time.monotonic()
+
+    async def wait_for_slot() -> None:
+        nonlocal next_start
+        # Reserving the slot has no await in between, so it is atomic on the event loop
+        now = time.monotonic()
+        start = max(now, next_start)
+        next_start = start + interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def fetch_with_semaphore(index: int, entry: PodcastEntry) -> Tuple[int, PodcastMetadata]:
+        async with host_semaphores[urlsplit(entry.xml_url).hostname], semaphore:
+            if interval:
+                await wait_for_slot()
+            metadata, cache_entry = await _fetch_rss_metadata(
+                entry, client, timeout, cached_feeds.get(entry.xml_url)
             )
+        if cache_entry:
+            cache_updates.append((entry.xml_url, *cache_entry))
+        return index, metadata
 
-            progress.update(task, completed=True)
-    else:
-        results = await asyncio.gather(
-            *[fetch_with_semaphore(entry) for entry in entries]
-        )
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) if verbose else nullcontext()
 
-    return results
+    async with create_feed_client(timeout, connection_pool_size) as client:
+        with progress:
+            if verbose:
+                task = progress.add_task(f"Fetching RSS feeds for {len(entries)} podcasts...", total=None)
+
+            for result in asyncio.as_completed(
+                [fetch_with_semaphore(i, entry) for i, entry in enumerate(entries)]
+            ):
+                yield await result
+
+            if verbose:
+                progress.update(task, completed=True)
+
+    if feed_cache is not None and cache_updates:
+        feed_cache.set_many(cache_updates)
 
 
 def fetch_all_rss_metadata_sync(
     entries: List[PodcastEntry],
     max_concurrent: int = 10,
     timeout: int = 30,
-    verbose: bool = False
+    verbose: bool = False,
+    feed_cache: Optional[FeedCache] = None,
+    requests_per_second: Optional[float] = None,
+    per_host_concurrency: int = 6,
+    connection_pool_size: int = 100
 ) -> List[PodcastMetadata]:
     """
     Synchronous wrapper for fetch_all_rss_metadata.
@@ -179,10 +478,17 @@ def fetch_all_rss_metadata_sync(
         max_concurrent: Maximum concurrent requests
         timeout: Request timeout in seconds
         verbose: Show progress information
+        feed_cache: Optional cache for conditional requests
+        requests_per_second: Maximum new requests per second (None for unlimited)
+        per_host_concurrency: Maximum concurrent requests to a single host
+        connection_pool_size: Maximum open connections across all hosts
 
     Returns:
         List of PodcastMetadata objects
     """
     return asyncio.run(
-        fetch_all_rss_metadata(entries, max_concurrent, timeout, verbose)
+        fetch_all_rss_metadata(
+            entries, max_concurrent, timeout, verbose, feed_cache,
+            requests_per_second, per_host_concurrency, connection_pool_size
+        )
     )
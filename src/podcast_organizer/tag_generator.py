@@ -1,14 +1,20 @@
 """Tag generation utilities for podcasts."""
 
 import re
-from typing import List, Set
+from typing import List, Set, Tuple
 
 
 # Common podcast-related stop words to exclude from tags
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     'the', 'a', 'an', 'and', 'or', 'but', 'with', 'from', 'to', 'of', 'in', 'on',
     'for', 'is', 'at', 'by', 'as', 'podcast', 'podcasts', 'show', 'episode', 'episodes'
-}
+})
+
+# Separators between words in a category name
+SEPARATOR_RE = re.compile(r'[&/,\s]+')
+
+# Candidate title keywords: words of 3+ letters
+WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
 
 
 def generate_tags_from_category(category: str, max_tags: int = 3) -> List[str]:
@@ -26,7 +32,7 @@ def generate_tags_from_category(category: str, max_tags: int = 3) -> List[str]:
         return []
 
     # Split on common separators
-    words = re.split(r'[&/,\s]+', category.lower())
+    words = SEPARATOR_RE.split(category.lower())
 
     # Filter out stop words, but keep short words if they're uppercase (acronyms like AI)
     tags = []
@@ -42,14 +48,7 @@ def generate_tags_from_category(category: str, max_tags: int = 3) -> List[str]:
             tags.append(word)
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_tags = []
-    for tag in tags:
-        if tag not in seen:
-            seen.add(tag)
-            unique_tags.append(tag)
-
-    return unique_tags[:max_tags]
+    return list(dict.fromkeys(tags))[:max_tags]
 
 
 def extract_keywords_from_title(title: str, max_keywords: int = 2) -> List[str]:
@@ -66,14 +65,10 @@ def extract_keywords_from_title(title: str, max_keywords: int = 2) -> List[str]:
     if not title:
         return []
 
-    # Remove common patterns
-    title = re.sub(r'\bpodcast\b', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\bthe\b', '', title, flags=re.IGNORECASE)
-
     # Split into words
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
+    words = WORD_RE.findall(title.lower())
 
-    # Filter stop words
+    # Filter stop words (including "the" and "podcast")
     keywords = [
         word
         for word in words
@@ -81,14 +76,7 @@ def extract_keywords_from_title(title: str, max_keywords: int = 2) -> List[str]:
     ]
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_keywords.append(keyword)
-
-    return unique_keywords[:max_keywords]
+    return list(dict.fromkeys(keywords))[:max_keywords]
 
 
 def generate_tags_for_podcast(
@@ -107,11 +95,51 @@ def generate_tags_for_podcast(
     Returns:
         List of tags combining category-based and title-based tags
     """
-    all_tags = []
-
     # Start with category tags (priority)
-    category_tags = generate_tags_from_category(category)
-    all_tags.extend(category_tags)
+    return add_title_keywords(generate_tags_from_category(category), title, max_total_tags)
+
+
+def generate_tags_for_podcasts_batch(
+    pairs: List[Tuple[str, str]],
+    max_total_tags: int = 5
+) -> List[List[str]]:
+    """
+    Generate tags for many podcasts at once.
+
+    Category tags are computed once per distinct category and shared by all
+    podcasts in that category.
+
+    Args:
+        pairs: List of (category, title) tuples
+        max_total_tags: Maximum total tags per podcast
+
+    Returns:
+        List of tag lists, in the same order as pairs
+    """
+    category_tags = {
+        category: generate_tags_from_category(category)
+        for category in {category for category, _ in pairs}
+    }
+
+    return [
+        add_title_keywords(category_tags[category], title, max_total_tags)
+        for category, title in pairs
+    ]
+
+
+def add_title_keywords(category_tags: List[str], title: str, max_total_tags: int = 5) -> List[str]:
+    """
+    Extend category tags with keywords from the title.
+
+    Args:
+        category_tags: Tags derived from the category (not modified)
+        title: Podcast title
+        max_total_tags: Maximum total tags to return
+
+    Returns:
+        New list of category tags followed by title keywords
+    """
+    all_tags = list(category_tags)
 
     # Add title keywords if we have room
     remaining = max_total_tags - len(all_tags)
@@ -119,9 +147,11 @@ def generate_tags_for_podcast(
         title_keywords = extract_keywords_from_title(title, max_keywords=remaining)
 
         # Only add keywords that aren't already covered by category tags
+        seen = set(all_tags)
         for keyword in title_keywords:
-            if keyword not in all_tags:
+            if keyword not in seen:
                 all_tags.append(keyword)
+                seen.add(keyword)
                 if len(all_tags) >= max_total_tags:
                     break
 
@@ -151,11 +181,4 @@ def deduplicate_tags(tags: List[str]) -> List[str]:
     Returns:
         List of unique, normalized tags (with dashes instead of spaces)
     """
-    seen = set()
-    unique = []
-    for tag in tags:
-        tag_normalized = normalize_tag(tag)
-        if tag_normalized and tag_normalized not in seen:
-            seen.add(tag_normalized)
-            unique.append(tag_normalized)
-    return unique
+    return [tag for tag in dict.fromkeys(map(normalize_tag, tags)) if tag]
@@ -0,0 +1,21 @@
+"""Tests for ai_enricher helpers."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path, as the podcast-organizer entry point does
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from podcast_organizer.ai_enricher import clean_description
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("<p><img src=x></p>", ""),
+    ("<script>alert(1)</script><style>p { color: red; }</style>", ""),
+    ("&nbsp;", ""),
+    ("a &amp; <b>b</b>", "a & b"),
+])
+def test_clean_description(text, expected):
+    assert clean_description(text) == expected